@@ -0,0 +1,30 @@
+import io
+from contextlib import redirect_stdout
+
+import score_optimizer as so
+
+def quiet(fn, *args, **kwargs):
+    # the optimizer reports progress with print()
+    with redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+def test_optimize_word_order(benchmark, solved_board):
+    paths, scores = solved_board
+    benchmark(quiet, so.optimize_word_order, paths, scores)
+
+def test_ensure_efficient_coverage(benchmark, solved_board):
+    paths, scores = solved_board
+    benchmark(so.ensure_efficient_coverage, paths, max_words=60, scores=scores)
+
+def test_tune_coverage_params(benchmark, solved_board):
+    paths, scores = solved_board
+    top = sorted(paths, key=lambda x: -scores[x[0]])[:60]
+    benchmark(quiet, so.tune_coverage_params, top, max_words=len(top), scores=scores)
+
+def test_ensure_exact_coverage(benchmark, solved_board):
+    paths, _ = solved_board
+    benchmark(so.ensure_exact_coverage, paths)
+
+def test_optimize_for_deadline(benchmark, solved_board):
+    paths, scores = solved_board
+    benchmark(so.optimize_for_deadline, paths, 30.0, scores=scores)
@@ -0,0 +1,24 @@
+import pytest
+
+from solver.boggle_game_engine import ENGINES, BoggleSolver, load_engine_dictionary
+
+def test_build_trie(benchmark, dictionary_words):
+    benchmark.pedantic(BoggleSolver.build_trie, args=(dictionary_words,), rounds=3, iterations=1)
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_find_all_words(benchmark, request, engine, seed_boards):
+    if engine != "dawg":
+        # the other engines are built from the word list
+        request.getfixturevalue("dictionary_words")
+    load_engine_dictionary(engine)
+    solvers = [BoggleSolver(b, m, engine=engine) for b, m in seed_boards]
+
+    def solve_all():
+        return [s.find_all_words() for s in solvers]
+
+    benchmark(solve_all)
+
+def test_iter_words_first(benchmark, seed_boards):
+    # time to the first streamed word
+    solvers = [BoggleSolver(b, m, engine="dawg") for b, m in seed_boards]
+    benchmark(lambda: [next(s.iter_words()) for s in solvers])
@@ -0,0 +1,9 @@
+import twl
+
+WORDS = ["quixotic", "boggle", "zyzzyva", "aa", "notaword", "strengths", "qi", "xylophones"]
+
+def test_check(benchmark):
+    benchmark(lambda: [twl.check(w) for w in WORDS])
+
+def test_anagram(benchmark):
+    benchmark(lambda: list(twl.anagram("retains")))
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from tile_preprocessing import board_batch, grid_views, tile_images
+
+BOARD_PX = 584  # CROP_BOX is 584 x 582 pixels
+
+@pytest.fixture(scope="module")
+def board():
+    return np.random.default_rng(0).integers(0, 256, (BOARD_PX, BOARD_PX, 3), dtype=np.uint8)
+
+def test_board_batch(benchmark, board):
+    # the runner's path: cropped board -> (16, 1, 28, 28) model input
+    benchmark(board_batch, board)
+
+@pytest.fixture(scope="module")
+def board_capture(tmp_path_factory):
+    # a board-only capture as the runner archives it, CROP_BOX sized
+    from auto_tile_cropper import CROP_BOX
+    left, top, right, bottom = CROP_BOX
+    pixels = np.random.default_rng(0).integers(0, 256, (bottom - top, right - left, 3), dtype=np.uint8)
+    path = tmp_path_factory.mktemp("capture") / "board.png"
+    Image.fromarray(pixels).save(path)
+    return path
+
+def test_crop_tiles(benchmark, board_capture, tmp_path):
+    # the tile cropper's path: capture -> 16 resized tile PNGs
+    from auto_tile_cropper import crop_tiles_from_image
+    benchmark(crop_tiles_from_image, str(board_capture), str(tmp_path))
+
+@pytest.fixture(scope="module")
+def predictor():
+    pytest.importorskip("torch")
+    from auto_boggle_runner import MODEL_PATH
+    if not os.path.exists(MODEL_PATH):
+        pytest.skip(f"{MODEL_PATH} not found")
+    from predict_tile_letter import Predictor
+    return Predictor(MODEL_PATH)
+
+def test_predict_single(benchmark, predictor, board):
+    # one forward pass per tile
+    tiles = tile_images(grid_views(board))
+    benchmark(lambda: [predictor.predict_letter_bonus_confidence(t) for t in tiles])
+
+def test_predict_batched(benchmark, predictor, board):
+    # one forward pass per board
+    benchmark(predictor.predict_board, board)
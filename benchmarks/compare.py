@@ -0,0 +1,35 @@
+# compare.py
+#
+# Run the benchmark suite against the stored baselines.
+#
+#   python benchmarks/compare.py                  # compare with the latest baseline
+#   python benchmarks/compare.py --against 0001   # compare with a specific run
+#   python benchmarks/compare.py --save           # store this run as the new baseline
+#
+# Comparisons fail when any benchmark's median regresses by more than
+# --threshold (default 15%). Extra arguments go to pytest, e.g. -k solver.
+
+import argparse
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the benchmarks and compare with a stored baseline")
+    parser.add_argument("--save", action="store_true", help="Store this run as a new baseline")
+    parser.add_argument("--name", default="baseline", help="Name for a saved baseline")
+    parser.add_argument("--against", default="", help="Baseline id to compare with (default: latest)")
+    parser.add_argument("--threshold", default="15%", help="Allowed median regression, e.g. 15%% or 0.002")
+    args, extra = parser.parse_known_args()
+
+    os.chdir(ROOT)
+    pytest_args = ["benchmarks", "-q"]
+    if args.save:
+        pytest_args.append(f"--benchmark-save={args.name}")
+    else:
+        compare = "--benchmark-compare" + (f"={args.against}" if args.against else "")
+        pytest_args += [compare, f"--benchmark-compare-fail=median:{args.threshold}"]
+    sys.exit(pytest.main(pytest_args + extra))
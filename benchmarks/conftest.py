@@ -0,0 +1,55 @@
+# conftest.py
+#
+# Benchmarks for the solver, optimizer, dictionary and vision hot paths,
+# run with pytest-benchmark (pip install pytest-benchmark) from the repo root:
+#
+#   python -m pytest benchmarks                       # run and print timings
+#   python benchmarks/compare.py --save               # store a new baseline
+#   python benchmarks/compare.py                      # compare against the latest baseline
+#
+# Inputs are fixed (seeded boards and the word sets solved from them), so
+# numbers are comparable across commits on the same machine. Baselines
+# live in benchmarks/baselines/<machine>/ and are not committed: save one on
+# each bot machine, with torch and the model installed so the Predictor
+# single vs. batched pair is measured too.
+
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "scripts"), os.path.join(ROOT, "scripts", "solver")]
+# the engine resolves data/ and its caches relative to the working directory
+os.chdir(ROOT)
+
+from solver.boggle_game_engine import BOGGLE_DICE, DICT_PATH, BoggleSolver, generate_random_board
+
+SEED = 20240601
+N_BOARDS = 8
+
+@pytest.fixture(scope="session")
+def seed_boards():
+    # (board, modifiers) pairs rolled from the standard dice
+    rng = random.Random(SEED)
+    random.seed(SEED)
+    mods = ["normal"] * 12 + ["DL", "TL", "DW", "TW"]
+    return [
+        (generate_random_board(BOGGLE_DICE[4]), [[rng.choice(mods) for _ in range(4)] for _ in range(4)])
+        for _ in range(N_BOARDS)
+    ]
+
+@pytest.fixture(scope="session")
+def solved_board(seed_boards):
+    # the seed board with the most words, solved: (all_paths, scores)
+    results = [BoggleSolver(b, m, engine="dawg").find_all_words() for b, m in seed_boards]
+    raw = max(results, key=len)
+    return [(w, p) for w, (_, p) in raw.items()], {w: pts for w, (pts, _) in raw.items()}
+
+@pytest.fixture(scope="session")
+def dictionary_words():
+    if not os.path.exists(DICT_PATH):
+        pytest.skip(f"{DICT_PATH} not found (run scripts/dump_twl06.py)")
+    from solver.boggle_game_engine import load_dictionary
+    return load_dictionary()
@@ -1,87 +1,138 @@
 # auto_boggle_runner.py
 
 import argparse
+import queue
+import threading
 import time
 import os
 from PIL import ImageGrab, Image
 
+from tile_preprocessing import frame_array
+
 # === IMPORT YOUR OPTIMIZERS ===
 from score_optimizer import (
-    word_score,
     tune_coverage_params,
     ensure_efficient_coverage,
+    ensure_exact_coverage,
+    optimize_for_deadline,
 )
 
 # === CONFIG ===
 MODEL_PATH = "models/cnn_model.pt"
 CROP_BOX   = (811, 508, 1395, 1090)
+# Tiles per row: 4 (Boggle), 5 (Big Boggle) or 6 (Super Big Boggle)
+GRID_SIZE  = 4
 
 # How many top-scoring words to consider for tuning
 TUNE_CANDIDATES = 60
+# Wall-clock budget (seconds) for the parameter search
+TUNE_BUDGET = 0.05
+
+# Archive every captured board to SCREENSHOT_DIR (written off the hot path)
+ARCHIVE_SCREENSHOTS = True
+SCREENSHOT_DIR = "data/screenshots"
+
+_archive_queue = None
+
+def _archive_worker(q):
+    while True:
+        img, path = q.get()
+        try:
+            img.save(path)
+        except OSError as e:
+            print(f"⚠️ Could not archive {path}: {e}")
+        finally:
+            q.task_done()
 
-def capture_full_screenshot():
-    os.makedirs("data/screenshots", exist_ok=True)
+def archive_screenshot(img):
+    global _archive_queue
+    if _archive_queue is None:
+        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+        _archive_queue = queue.Queue()
+        threading.Thread(target=_archive_worker, args=(_archive_queue,), daemon=True).start()
     ts = time.strftime("%Y%m%d-%H%M%S")
-    path = f"data/screenshots/{ts}.png"
-    print(f"\n📸 Capturing screenshot to {path}")
-    img = ImageGrab.grab()
-    img.save(path)
-    time.sleep(0.2)
+    _archive_queue.put((img, os.path.join(SCREENSHOT_DIR, f"{ts}.png")))
+
+def flush_archive():
+    if _archive_queue is not None:
+        _archive_queue.join()
+
+def prefetch(iterable):
+    # run `iterable` on a producer thread and yield its items as they
+    # arrive, so the consumer overlaps with the producer; the producer's
+    # exceptions are re-raised here
+    q = queue.Queue()
+    done = object()
+
+    def produce():
+        try:
+            for item in iterable:
+                q.put(item)
+        except BaseException as e:
+            q.put(e)
+        finally:
+            q.put(done)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while True:
+        item = q.get()
+        if item is done:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+def capture_board(archive: bool = ARCHIVE_SCREENSHOTS):
+    # grab only the board region and hand it straight to classification
+    print("\n📸 Capturing board")
+    img = ImageGrab.grab(bbox=CROP_BOX)
+    if archive:
+        archive_screenshot(img)
     return img
 
-def classify_board(predictor, full_img):
-    board_img = full_img.crop(CROP_BOX)
-    w, h = board_img.size
-    tw, th = w // 4, h // 4
-    board, mods = [], []
-    for r in range(4):
-        row, mrow = [], []
-        for c in range(4):
-            tile = board_img.crop((c*tw, r*th, (c+1)*tw, (r+1)*th))
-            letter, bonus, _, _ = predictor.predict_letter_bonus_confidence(tile)
-            row.append(letter)
-            mrow.append(bonus)
-        board.append(row)
-        mods.append(mrow)
+def classify_board(predictor, board_img):
+    letters, bonuses, _, _ = predictor.predict_board(frame_array(board_img))
+    bonuses = bonuses.tolist()
+    g = predictor.grid_size
+    board = [letters[r*g:(r+1)*g] for r in range(g)]
+    mods = [bonuses[r*g:(r+1)*g] for r in range(g)]
     return board, mods
 
 def solve_board(board, mods):
-    from solver.boggle_game_engine import BoggleSolver, load_dictionary
-    dictionary = load_dictionary()
-    solver = BoggleSolver(board, mods, dictionary)
+    from solver.boggle_game_engine import BoggleSolver
+    solver = BoggleSolver(board, mods, engine="dawg")
     return solver.find_all_words()
 
-def main(preview_mode: bool):
-    # import heavy modules inside main
-    from predict_tile_letter import Predictor
-    from play_boggle import play_words
-
-    # 1) Screenshot & classify
-    img = capture_full_screenshot()
-    print("\n🔍 Loading model and classifying board...")
-    predictor = Predictor(MODEL_PATH)
-    board, mods = classify_board(predictor, img)
+def stream_board(board, mods):
+    # (word, path) pairs in best-first order while the search is still running
+    from solver.boggle_game_engine import BoggleSolver
+    solver = BoggleSolver(board, mods, engine="dawg")
+    for word, pts, path in prefetch(solver.iter_words()):
+        print(f"  + {word:10s} → {pts:3d} pts")
+        yield word, path
 
-    print("\n🧠 Predicted Board:")
-    for row in board:
-        print(" ".join(row))
-
-    # 2) Solve
-    print("\n🔎 Solving board...")
-    raw = solve_board(board, mods)
-    print(f"✅ Found {len(raw)} words")
+def load_predictor(grid_size: int = GRID_SIZE):
+    from predict_tile_letter import Predictor
+    return Predictor(MODEL_PATH, grid_size)
 
-    # 3) Build list of (word, path)
-    all_paths = [(w, p) for w, (_, p) in raw.items()]
+def tuned_play_order(all_paths, scores, grid_size: int = GRID_SIZE, **timing):
+    # timing: tile_delay / word_delay / input_pause, as play_boggle uses them
+    # Secure the full-coverage bonus first with the fastest covering words
+    cover, rest = ensure_exact_coverage(all_paths, grid_size=grid_size, **timing)
+    if cover:
+        print(f"\n🧩 {len(cover)} words cover every tile")
 
-    # 4) Pre‑sort by base score and take top candidates for tuning
-    sorted_by_score = sorted(all_paths, key=lambda x: -word_score(x[0]))
+    # Pre‑sort by base score and take top candidates for tuning
+    sorted_by_score = sorted(rest, key=lambda x: -scores[x[0]])
     candidates = sorted_by_score[:TUNE_CANDIDATES]
     print(f"\n🔧 Tuning on top {len(candidates)} words to maximize efficiency + coverage…")
     best_params = tune_coverage_params(
         candidates,
-        grid_size=4,
+        grid_size=grid_size,
         max_words=len(candidates),
+        time_budget=TUNE_BUDGET,
+        scores=scores,
+        **timing
     )
     # remove the 'score' entry
     tune_cfg = {
@@ -89,25 +140,75 @@ def main(preview_mode: bool):
         if k in ("time_per_tile", "overhead_per_word", "lambda_eff", "lambda_cov")
     }
 
-    # 5) Pick the optimal subset + order
+    # Pick the optimal subset + order
     selected, remaining = ensure_efficient_coverage(
         candidates,
-        grid_size=4,
+        grid_size=grid_size,
         max_words=len(candidates),
+        scores=scores,
         **tune_cfg
     )
-    final_list = selected + remaining
+    return cover + selected + remaining
+
+def play_round(
+    predictor,
+    preview_mode: bool,
+    archive: bool = ARCHIVE_SCREENSHOTS,
+    deadline: float = None,
+    stream: bool = False,
+):
+    # import heavy modules on first use
+    from play_boggle import play_words, TILE_DELAY, WORD_DELAY, INPUT_PAUSE
+
+    # 1) Screenshot & classify
+    img = capture_board(archive)
+    print("\n🔍 Classifying board...")
+    board, mods = classify_board(predictor, img)
+    grid_size = predictor.grid_size
+
+    print("\n🧠 Predicted Board:")
+    for row in board:
+        print(" ".join(row))
+
+    # Streaming: start dragging words while the rest of the board is searched
+    if stream:
+        print("\n🎮 Streaming moves while solving…")
+        play_words(stream_board(board, mods), preview_only=preview_mode, grid_size=grid_size)
+        return
+
+    # 2) Solve
+    print("\n🔎 Solving board...")
+    raw = solve_board(board, mods)
+    print(f"✅ Found {len(raw)} words")
+
+    # 3) Build list of (word, path) and keep the solver's modifier-aware points
+    all_paths = [(w, p) for w, (_, p) in raw.items()]
+    scores = {w: pts for w, (pts, _) in raw.items()}
+
+    # 4-5) Pick the subset + order: fit the seconds left in the round using
+    # the real input timings, or fall back to the tuned coverage heuristic
+    if deadline is not None:
+        final_list, expected = optimize_for_deadline(
+            all_paths, deadline, tile_delay=TILE_DELAY, word_delay=WORD_DELAY,
+            input_pause=INPUT_PAUSE, grid_size=grid_size, scores=scores,
+        )
+        print(f"\n⏱️ Planned {len(final_list)} words for {deadline:.1f}s → expected {expected} points")
+    else:
+        final_list = tuned_play_order(
+            all_paths, scores, grid_size,
+            tile_delay=TILE_DELAY, word_delay=WORD_DELAY, input_pause=INPUT_PAUSE,
+        )
 
     # 6) Print the final play order & points
     print("\n🎯 Final optimized play order:")
     total_base = 0
     for idx, (word, path) in enumerate(final_list, start=1):
-        pts = word_score(word)
-        print(f"  {idx:2d}. {word:10s} → base {pts:3d}")
+        pts = scores[word]
+        print(f"  {idx:2d}. {word:10s} → {pts:3d} pts")
         total_base += pts
 
     # Check full coverage bonus
-    all_tiles = {(r, c) for r in range(4) for c in range(4)}
+    all_tiles = {(r, c) for r in range(grid_size) for c in range(grid_size)}
     covered = set()
     for _, path in final_list:
         covered |= set(path)
@@ -119,7 +220,18 @@ def main(preview_mode: bool):
 
     # 7) Play!
     print("🎮 Executing moves…")
-    play_words(final_list, preview_only=preview_mode)
+    play_words(final_list, preview_only=preview_mode, grid_size=grid_size)
+
+def main(
+    preview_mode: bool,
+    archive: bool = ARCHIVE_SCREENSHOTS,
+    deadline: float = None,
+    stream: bool = False,
+    grid_size: int = GRID_SIZE,
+):
+    print("\n🔍 Loading model...")
+    play_round(load_predictor(grid_size), preview_mode, archive, deadline, stream)
+    flush_archive()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -127,5 +239,24 @@ if __name__ == "__main__":
         "--preview", action="store_true",
         help="Only preview paths (no clicks)"
     )
+    parser.add_argument(
+        "--no-archive", action="store_true",
+        help="Don't save the captured board to data/screenshots"
+    )
+    parser.add_argument(
+        "--deadline", type=float, default=None,
+        help="Seconds left in the round; plan the play order to fit them"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Play words as the solver finds them instead of optimizing the order"
+    )
+    parser.add_argument(
+        "--grid-size", type=int, default=GRID_SIZE,
+        help="Tiles per row: 4, 5 (Big Boggle) or 6 (Super Big Boggle)"
+    )
     args = parser.parse_args()
-    main(args.preview)
+    main(
+        args.preview, archive=not args.no_archive, deadline=args.deadline,
+        stream=args.stream, grid_size=args.grid_size,
+    )
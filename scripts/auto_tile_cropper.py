@@ -1,6 +1,9 @@
 import os
+import argparse
 from PIL import Image
 
+from tile_preprocessing import frame_array, crop_box, grid_views, tile_images
+
 # === CONFIG ===
 CROP_BOX        = (811, 508, 1395, 1090)
 GRID_SIZE       = 4
@@ -10,30 +13,24 @@ BASE_DIR        = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SCREENSHOT_DIR  = os.path.join(BASE_DIR, "data", "screenshots")
 TILE_OUTPUT_DIR = os.path.join(BASE_DIR, "data", "unlabeled_tiles")
 
-def crop_tiles_from_image(image_path, output_dir):
-    image = Image.open(image_path)
-    cropped = image.crop(CROP_BOX)
-    width, height = cropped.size
-    tile_w, tile_h = width // GRID_SIZE, height // GRID_SIZE
+def crop_tiles_from_image(image_path, output_dir, grid_size=GRID_SIZE):
+    with Image.open(image_path) as image:
+        frame = frame_array(image)
+    left, top, right, bottom = CROP_BOX
+    # the runner archives board-only captures; full screenshots still get cropped
+    if frame.shape[:2] == (bottom - top, right - left):
+        board = frame
+    else:
+        board = crop_box(frame, CROP_BOX)
 
     base_name = os.path.splitext(os.path.basename(image_path))[0]
-    tile_num = 0
-
-    for row in range(GRID_SIZE):
-        for col in range(GRID_SIZE):
-            left   = col * tile_w
-            top    = row * tile_h
-            right  = left + tile_w
-            bottom = top + tile_h
-
-            tile = cropped.crop((left, top, right, bottom))
-            tile = tile.resize(RESIZED_TILE)
-            out_fname = f"{base_name}_tile_{tile_num:02}.png"
-            tile.save(os.path.join(output_dir, out_fname))
-
-            tile_num += 1
+    for tile_num, tile in enumerate(tile_images(grid_views(board, grid_size))):
+        # PIL's default (bicubic) filter, like the existing data/boggle_tiles set
+        tile = tile.resize(RESIZED_TILE)
+        out_fname = f"{base_name}_tile_{tile_num:02}.png"
+        tile.save(os.path.join(output_dir, out_fname))
 
-def process_all_screenshots():
+def process_all_screenshots(grid_size=GRID_SIZE):
     os.makedirs(TILE_OUTPUT_DIR, exist_ok=True)
     screenshots = [
         f for f in os.listdir(SCREENSHOT_DIR)
@@ -45,7 +42,7 @@ def process_all_screenshots():
         image_path = os.path.join(SCREENSHOT_DIR, fname)
 
         # 1) Crop & save tiles
-        crop_tiles_from_image(image_path, TILE_OUTPUT_DIR)
+        crop_tiles_from_image(image_path, TILE_OUTPUT_DIR, grid_size)
         print(f"Cropped tiles from: {fname}")
 
         # 2) Delete the original screenshot
@@ -56,4 +53,6 @@ def process_all_screenshots():
             print(f"⚠️ Could not delete {fname}: {e}")
 
 if __name__ == "__main__":
-    process_all_screenshots()
+    parser = argparse.ArgumentParser(description="Crop archived board screenshots into tiles")
+    parser.add_argument("--grid-size", type=int, default=GRID_SIZE, help="Tiles per row (4, 5 or 6)")
+    process_all_screenshots(parser.parse_args().grid_size)
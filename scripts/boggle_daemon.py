@@ -0,0 +1,154 @@
+# boggle_daemon.py
+#
+# Long-lived local service that keeps the CNN, the dictionary and the solver
+# warm between rounds. The hotkey runner and the launcher send it "play"
+# commands instead of starting a fresh auto_boggle_runner.py process, so a
+# round costs a screenshot plus a solve rather than a full interpreter start.
+#
+#   python scripts/boggle_daemon.py            # start (from the repo root)
+#   python scripts/boggle_daemon.py --stop     # ask a running daemon to exit
+#
+# Every daemon start binds the port, then writes a fresh random authkey to
+# DAEMON_KEY_FILE, which only the current user can read; clients must present
+# it to connect. A second daemon fails on the bind and leaves the running
+# daemon's key alone. Clients treat a refused connection and a rejected key
+# (e.g. a stale key file) alike: no usable daemon.
+# Commands and replies are JSON (send_bytes/recv_bytes), never pickles, so
+# even an authenticated client can only send data.
+
+import argparse
+import json
+import os
+import queue
+import secrets
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+# === CONFIG ===
+DAEMON_ADDRESS = ("localhost", 6150)
+DAEMON_KEY_FILE = os.path.join(os.path.expanduser("~"), ".boggle_daemon.key")
+MAX_MESSAGE_BYTES = 64 * 1024
+# what send_command raises when there is no daemon to talk to
+DAEMON_UNAVAILABLE = (ConnectionRefusedError, AuthenticationError)
+
+def write_authkey(key: bytes, path: str = DAEMON_KEY_FILE):
+    # key in a file created owner-read/write only, swapped in atomically
+    tmp = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    os.replace(tmp, path)
+
+def read_authkey(path: str = DAEMON_KEY_FILE) -> bytes:
+    # no key file means no daemon has been started
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        raise ConnectionRefusedError(f"no daemon key at {path}") from None
+
+def send_json(conn, obj: dict):
+    conn.send_bytes(json.dumps(obj).encode("utf-8"))
+
+def recv_json(conn) -> dict:
+    msg = json.loads(conn.recv_bytes(MAX_MESSAGE_BYTES).decode("utf-8"))
+    if not isinstance(msg, dict):
+        raise ValueError("expected a JSON object")
+    return msg
+
+class BoggleDaemon:
+    def __init__(self, grid_size: int = None):
+        # play_boggle installs a SIGINT handler at import, which is only
+        # allowed on the main thread, so warm everything up here
+        import play_boggle  # noqa: F401
+        from auto_boggle_runner import load_predictor, GRID_SIZE
+        from solver.boggle_game_engine import get_dawg
+
+        print("🔥 Warming up model and dictionary...")
+        self.predictor = load_predictor(grid_size or GRID_SIZE)
+        get_dawg()
+
+        self.jobs = queue.Queue()
+        self.busy = threading.Event()
+        threading.Thread(target=self._worker, daemon=True).start()
+
+    def _worker(self):
+        from auto_boggle_runner import play_round
+        while True:
+            preview, deadline = self.jobs.get()
+            try:
+                play_round(self.predictor, preview, deadline=deadline)
+            except Exception as e:
+                print(f"⚠️ Round failed: {e}")
+            finally:
+                self.busy.clear()
+
+    def submit(self, preview: bool, deadline: float = None) -> bool:
+        if self.busy.is_set():
+            return False
+        self.busy.set()
+        self.jobs.put((preview, deadline))
+        return True
+
+def serve(address=DAEMON_ADDRESS, key_file: str = DAEMON_KEY_FILE, grid_size: int = None):
+    authkey = secrets.token_bytes(32)
+    try:
+        listener = Listener(address, authkey=authkey)
+    except OSError as e:
+        print(f"⚠️ Cannot listen on {address[0]}:{address[1]} (already running?): {e}")
+        return
+    # only the daemon that owns the port publishes its key; clients that
+    # connect while the model warms up wait in the accept backlog
+    write_authkey(authkey, key_file)
+    with listener:
+        daemon = BoggleDaemon(grid_size)
+        print(f"🟢 Boggle daemon listening on {address[0]}:{address[1]}")
+        while True:
+            try:
+                conn = listener.accept()
+            except Exception as e:  # failed handshake, e.g. a wrong key
+                print(f"⚠️ Rejected connection: {e}")
+                continue
+            with conn:
+                try:
+                    msg = recv_json(conn)
+                except (OSError, EOFError, ValueError) as e:
+                    print(f"⚠️ Bad message: {e}")
+                    continue
+                cmd = msg.get("cmd")
+                if cmd == "play":
+                    deadline = msg.get("deadline")
+                    if deadline is not None and not isinstance(deadline, (int, float)):
+                        send_json(conn, {"ok": False, "error": "deadline must be a number"})
+                        continue
+                    send_json(conn, {"ok": daemon.submit(bool(msg.get("preview")), deadline)})
+                elif cmd == "ping":
+                    send_json(conn, {"ok": True, "busy": daemon.busy.is_set()})
+                elif cmd == "stop":
+                    send_json(conn, {"ok": True})
+                    break
+                else:
+                    send_json(conn, {"ok": False, "error": f"unknown command {cmd!r}"})
+    print("🔴 Boggle daemon stopped.")
+
+def send_command(cmd: str, address=DAEMON_ADDRESS, key_file: str = DAEMON_KEY_FILE, **kwargs) -> dict:
+    """
+    Send one command to a running daemon and return its reply.
+    Raises ConnectionRefusedError if no daemon is listening and
+    multiprocessing.AuthenticationError if it rejects the key file's key;
+    callers treat both as DAEMON_UNAVAILABLE.
+    """
+    with Client(address, authkey=read_authkey(key_file)) as conn:
+        send_json(conn, {"cmd": cmd, **kwargs})
+        return recv_json(conn)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep the Boggle bot warm between rounds")
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    parser.add_argument("--grid-size", type=int, default=None, help="Tiles per row (4, 5 or 6)")
+    args = parser.parse_args()
+    if args.stop:
+        print(send_command("stop"))
+    else:
+        serve(grid_size=args.grid_size)
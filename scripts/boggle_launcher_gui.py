@@ -1,6 +1,7 @@
 # boggle_launcher_gui.py
 
 import tkinter as tk
+from tkinter import messagebox
 import subprocess
 import sys
 import os
@@ -43,6 +44,19 @@ class BoggleLauncher:
         self.launch_script(preview=False)
 
     def launch_script(self, preview):
+        # Hand the round to a warm daemon if one is running
+        from boggle_daemon import DAEMON_UNAVAILABLE, send_command
+        try:
+            reply = send_command("play", preview=preview)
+        except DAEMON_UNAVAILABLE:
+            reply = None
+        if reply is not None:
+            if not reply["ok"]:
+                messagebox.showwarning("Boggle Bot", "⚠️ Already running.")
+                return
+            self.root.destroy()
+            return
+
         # Ensure we invoke the same interpreter and correct script path
         script = os.path.join(os.path.dirname(__file__), "auto_boggle_runner.py")
         args = [sys.executable, script]
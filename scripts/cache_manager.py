@@ -0,0 +1,151 @@
+# cache_manager.py
+#
+# Inspect and trim the solver's on-disk caches, run from the repo root:
+#
+#   python scripts/cache_manager.py stats
+#   python scripts/cache_manager.py prune                      # to the configured limits
+#   python scripts/cache_manager.py prune --max-mb 64 --policy lfu
+#   python scripts/cache_manager.py prune --max-entries 20000 --legacy
+#
+# .boggle_cache/boards.sqlite   candidate ids per board (BOARD_STORE_PATH, at
+#                               the repo root, also filled by
+#                               boggle_batch_cache.py), capped by
+#                               BOARD_CACHE_MAX_BYTES / _MAX_ENTRIES and
+#                               evicted LRU or LFU (BOARD_CACHE_POLICY)
+# .trie_cache/                  compiled dictionary and packed trie, one set
+#                               per dictionary version; files for other
+#                               versions and interrupted builds are stale
+# .boggle_cache/*.pkl           old one-pickle-per-board caches; import them
+#                               with boggle_batch_cache.py --import-pickles,
+#                               then remove them with prune --legacy; they are
+#                               tracked in git, so that deletion shows up as
+#                               a change to commit (or undo with git checkout)
+
+import argparse
+import glob
+import json
+import os
+from typing import List, Optional
+
+from solver.boggle_game_engine import (
+    BOARD_STORE_PATH, DICT_CACHE_DIR, TRIE_CACHE_DIR, dictionary_digest, get_board_store,
+)
+
+def _files(paths: List[str]) -> dict:
+    return {"files": len(paths), "bytes": sum(os.path.getsize(p) for p in paths)}
+
+def store_file_bytes() -> int:
+    # the database plus its write-ahead log
+    files = [BOARD_STORE_PATH + suffix for suffix in ("", "-wal", "-shm")]
+    return sum(os.path.getsize(f) for f in files if os.path.exists(f))
+
+def stale_trie_files() -> List[str]:
+    # artifacts of other dictionary versions and leftover temp files
+    current = dictionary_digest() + "."
+    return [
+        p for p in glob.glob(os.path.join(TRIE_CACHE_DIR, "*"))
+        if not os.path.basename(p).startswith(current) or p.endswith(".tmp")
+    ]
+
+def legacy_pickles() -> List[str]:
+    return glob.glob(os.path.join(DICT_CACHE_DIR, "*.pkl"))
+
+def cache_stats() -> dict:
+    return {
+        # stats of a store that was never written don't create one
+        "board_store": get_board_store().stats() if os.path.exists(BOARD_STORE_PATH) else None,
+        "trie_cache": {
+            **_files(glob.glob(os.path.join(TRIE_CACHE_DIR, "*"))),
+            "stale": _files(stale_trie_files()),
+        },
+        "legacy_pickles": _files(legacy_pickles()),
+    }
+
+def prune(
+    max_bytes: Optional[int] = None,
+    max_entries: Optional[int] = None,
+    policy: Optional[str] = None,
+    legacy: bool = False,
+) -> dict:
+    """
+    Evict board store rows down to the given limits (the configured ones
+    when both are None), compact the store, delete stale trie cache files
+    and, with legacy=True, the old per-board pickles. Returns what was
+    removed.
+    """
+    removed = {"board_rows": 0, "board_bytes": 0}
+    if os.path.exists(BOARD_STORE_PATH):
+        store = get_board_store()
+        before = store_file_bytes()
+        rows, freed = store.evict(max_bytes, max_entries, policy)
+        if rows:
+            store.vacuum()
+        store.close()
+        removed = {
+            "board_rows": rows,
+            "board_bytes": freed,
+            "store_file_bytes": before - store_file_bytes(),
+        }
+
+    for key, paths in (("trie_cache", stale_trie_files()), ("legacy_pickles", legacy_pickles() if legacy else [])):
+        removed[key] = _files(paths)
+        for p in paths:
+            os.remove(p)
+    return removed
+
+def _mb(n: int) -> str:
+    return f"{n / (1024 * 1024):.1f} MB"
+
+def print_stats(stats: dict):
+    store = stats["board_store"]
+    print("\n📦 Board store")
+    if store is None:
+        print("  (empty)")
+    else:
+        limit = [f"{_mb(store['max_bytes'])}" if store["max_bytes"] is not None else None,
+                 f"{store['max_entries']} entries" if store["max_entries"] is not None else None]
+        limit = ", ".join(l for l in limit if l) or "none"
+        print(f"  entries   : {store['entries']} ({store['stale_entries']} for other dictionary versions)")
+        print(f"  data      : {_mb(store['bytes'])} in a {_mb(store['file_bytes'])} file")
+        print(f"  limits    : {limit}, {store['policy'].upper()} eviction")
+        rate = f"{store['hit_rate']:.1%}" if store["hit_rate"] is not None else "n/a"
+        print(f"  lookups   : {store['hits']} hits / {store['misses']} misses ({rate} hit rate)")
+        print(f"  evictions : {store['evictions']}")
+    trie = stats["trie_cache"]
+    print(f"\n🌲 Trie cache: {trie['files']} files, {_mb(trie['bytes'])} "
+          f"({trie['stale']['files']} stale, {_mb(trie['stale']['bytes'])})")
+    legacy = stats["legacy_pickles"]
+    if legacy["files"]:
+        print(f"🗃️ Legacy pickles: {legacy['files']} files, {_mb(legacy['bytes'])}")
+
+def print_pruned(removed: dict):
+    print(f"🧹 Evicted {removed['board_rows']} boards ({_mb(removed['board_bytes'])} of data)")
+    if "store_file_bytes" in removed:
+        print(f"  store file shrank by {_mb(removed['store_file_bytes'])}")
+    print(f"  removed {removed['trie_cache']['files']} stale trie cache files ({_mb(removed['trie_cache']['bytes'])})")
+    if removed["legacy_pickles"]["files"]:
+        print(f"  removed {removed['legacy_pickles']['files']} legacy pickles ({_mb(removed['legacy_pickles']['bytes'])})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show or trim the solver's on-disk caches")
+    parser.add_argument("command", choices=("stats", "prune"))
+    parser.add_argument("--max-mb", type=float, help="Board store size limit for prune")
+    parser.add_argument("--max-entries", type=int, help="Board store entry limit for prune")
+    parser.add_argument("--policy", choices=("lru", "lfu"), help="Eviction policy for prune")
+    parser.add_argument("--legacy", action="store_true",
+                        help="Also delete the old per-board .boggle_cache/*.pkl caches. These are tracked "
+                             "in git: import them with boggle_batch_cache.py --import-pickles first")
+    parser.add_argument("--json", action="store_true", help="Print the result as one JSON object")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        result = cache_stats()
+        report = print_stats
+    else:
+        max_bytes = None if args.max_mb is None else int(args.max_mb * 1024 * 1024)
+        result = prune(max_bytes, args.max_entries, args.policy, args.legacy)
+        report = print_pruned
+    if args.json:
+        print(json.dumps(result))
+    else:
+        report(result)
@@ -1,38 +1,54 @@
 import keyboard
 import subprocess
+import sys
 import threading
 import time
 
+from boggle_daemon import DAEMON_UNAVAILABLE, send_command
+
 # === CONFIG ===
 TRIGGER_HOTKEY = 'ctrl+alt+b'
 PAUSE_HOTKEY = 'ctrl+alt+p'
 NEXT_WORD_HOTKEY = 'space'
 
-IS_PLAYING = False
 IS_PREVIEW = True  # Set to True to run in preview mode
+DAEMON_START_TIMEOUT = 60.0
 PAUSE_FLAG = threading.Event()
 PAUSE_FLAG.set()
 
 # === FUNCTION ===
-def run_boggle():
-    global IS_PLAYING
-    if IS_PLAYING:
-        print("⚠️ Already running.")
+def ensure_daemon():
+    try:
+        send_command("ping")
         return
+    except DAEMON_UNAVAILABLE:
+        pass
 
-    IS_PLAYING = True
-    print("\n🚀 Starting Boggle run...\n")
-    args = ["python", "scripts/auto_boggle_runner.py"]
-    if IS_PREVIEW:
-        args.append("--preview")
+    print("🔥 Starting Boggle daemon...")
+    subprocess.Popen([sys.executable, "scripts/boggle_daemon.py"])
+    deadline = time.time() + DAEMON_START_TIMEOUT
+    while time.time() < deadline:
+        time.sleep(0.5)
+        try:
+            send_command("ping")
+            return
+        except DAEMON_UNAVAILABLE:
+            continue
+    raise RuntimeError("Boggle daemon did not start in time")
 
-    process = subprocess.Popen(args)
-    process.wait()
-    IS_PLAYING = False
-    print("\n✅ Finished.")
+def run_boggle():
+    print("\n🚀 Starting Boggle run...\n")
+    try:
+        reply = send_command("play", preview=IS_PREVIEW)
+    except DAEMON_UNAVAILABLE:
+        print("⚠️ Daemon is not running.")
+        return
+    if not reply["ok"]:
+        print("⚠️ Already running.")
 
 # === KEYBOARD LOOP ===
 def keyboard_listener():
+    ensure_daemon()
     print("\n🎮 Listening for hotkeys...")
     print(f"▶ Trigger: {TRIGGER_HOTKEY}\n▶ Pause:   {PAUSE_HOTKEY}\n▶ Next (Preview only): {NEXT_WORD_HOTKEY}")
 
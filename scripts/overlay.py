@@ -8,23 +8,23 @@ SCREEN_TOP_LEFT = (800, 500)
 SCREEN_BOTTOM_RIGHT = (1400, 1100)
 TILE_DISPLAY_TIME = 0.7
 
-def get_tile_coordinates():
+def get_tile_coordinates(grid_size=GRID_SIZE):
     x1, y1 = SCREEN_TOP_LEFT
     x2, y2 = SCREEN_BOTTOM_RIGHT
-    tile_w = (x2 - x1) // GRID_SIZE
-    tile_h = (y2 - y1) // GRID_SIZE
+    tile_w = (x2 - x1) // grid_size
+    tile_h = (y2 - y1) // grid_size
     coords = []
-    for r in range(GRID_SIZE):
+    for r in range(grid_size):
         row = []
-        for c in range(GRID_SIZE):
+        for c in range(grid_size):
             cx = x1 + c * tile_w + tile_w // 2
             cy = y1 + r * tile_h + tile_h // 2
             row.append((cx, cy))
         coords.append(row)
     return coords
 
-def draw_overlay_path(path, word):
-    tile_coords = get_tile_coordinates()
+def draw_overlay_path(path, word, grid_size=GRID_SIZE):
+    tile_coords = get_tile_coordinates(grid_size)
     screen_w = SCREEN_BOTTOM_RIGHT[0] + 100
     screen_h = SCREEN_BOTTOM_RIGHT[1] + 100
 
@@ -5,7 +5,7 @@ import sys
 import signal
 import pyautogui
 import keyboard
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 # Enable PyAutoGUI failsafe
 pyautogui.FAILSAFE = True
@@ -16,6 +16,9 @@ SCREEN_TOP_LEFT = (800, 500)
 SCREEN_BOTTOM_RIGHT = (1400, 1100)
 TILE_DELAY = 0.15
 WORD_DELAY = 0.3
+INPUT_PAUSE = 0.1  # pyautogui sleeps this long after every call
+
+pyautogui.PAUSE = INPUT_PAUSE
 
 PAUSE_KEY = 'p'
 EXIT_KEY  = 'esc'
@@ -36,15 +39,15 @@ def toggle_pause():
     paused = not paused
     print("⏸️ Paused." if paused else "▶️ Resumed.")
 
-def get_tile_coordinates() -> List[List[Tuple[int, int]]]:
+def get_tile_coordinates(grid_size: int = GRID_SIZE) -> List[List[Tuple[int, int]]]:
     x1, y1 = SCREEN_TOP_LEFT
     x2, y2 = SCREEN_BOTTOM_RIGHT
-    tile_w = (x2 - x1) // GRID_SIZE
-    tile_h = (y2 - y1) // GRID_SIZE
+    tile_w = (x2 - x1) // grid_size
+    tile_h = (y2 - y1) // grid_size
     coords: List[List[Tuple[int, int]]] = []
-    for r in range(GRID_SIZE):
+    for r in range(grid_size):
         row: List[Tuple[int, int]] = []
-        for c in range(GRID_SIZE):
+        for c in range(grid_size):
             cx = x1 + c * tile_w + tile_w // 2
             cy = y1 + r * tile_h + tile_h // 2
             row.append((cx, cy))
@@ -82,7 +85,11 @@ def draw_path(path: List[Tuple[int, int]], tile_coords: List[List[Tuple[int, int
         x, y = tile_coords[r][c]
         print(f" -> ({r},{c}) @ ({x},{y})")
 
-def play_words(paths: List[Tuple[str, List[Tuple[int, int]]]], preview_only: bool = False):
+def play_words(
+    paths: Iterable[Tuple[str, List[Tuple[int, int]]]],
+    preview_only: bool = False,
+    grid_size: int = GRID_SIZE
+):
     global paused
     paused = False
 
@@ -93,16 +100,18 @@ def play_words(paths: List[Tuple[str, List[Tuple[int, int]]]], preview_only: boo
     if preview_only:
         keyboard.add_hotkey('space', lambda: None)
 
-    tile_coords = get_tile_coordinates()
+    tile_coords = get_tile_coordinates(grid_size)
 
     if preview_only:
         print("\n▶ Controls (preview): SPACE = next word, ESC = exit preview\n")
     else:
         print("\n▶ Controls (live): P = pause/resume, ESC = emergency stop\n")
 
+    # paths may be a generator still being filled by the solver
+    total = len(paths) if hasattr(paths, "__len__") else "?"
     try:
         for i, (word, path) in enumerate(paths, 1):
-            print(f"\n▶ Word {i}/{len(paths)}: {word} ({len(path)} letters)")
+            print(f"\n▶ Word {i}/{total}: {word} ({len(path)} letters)")
             draw_path(path, tile_coords)
 
             if preview_only:
@@ -1,26 +1,28 @@
 import os
 import torch
-from torchvision import transforms
 from PIL import Image
 from model_definitions import MultiTaskCNN, index_to_letter, index_to_bonus
-
-IMG_SIZE = 28
+from tile_preprocessing import board_batch, crops_batch, IMG_SIZE, GRID_SIZE
 
 class Predictor:
-    def __init__(self, model_path):
+    def __init__(self, model_path, grid_size=GRID_SIZE):
+        self.grid_size = grid_size
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.model = MultiTaskCNN().to(self.device)
         self.model.load_state_dict(torch.load(model_path, map_location=self.device))
         self.model.eval()
 
-        self.transform = transforms.Compose([
-            transforms.Resize((IMG_SIZE, IMG_SIZE)),
-            transforms.Grayscale(),
-            transforms.ToTensor()
-        ])
+    def transform(self, tiles):
+        # shared vectorized preprocessing: a cropped board (PIL image or
+        # array) or a list of tile crops -> (n, 1, IMG_SIZE, IMG_SIZE) tensor
+        if isinstance(tiles, list):
+            batch = crops_batch(tiles, IMG_SIZE)
+        else:
+            batch = board_batch(tiles, self.grid_size, IMG_SIZE)
+        return torch.from_numpy(batch).to(self.device)
 
     def predict_letter_bonus_confidence(self, pil_img):
-        image = self.transform(pil_img).unsqueeze(0).to(self.device)
+        image = self.transform([pil_img])
         with torch.no_grad():
             letter_logits, bonus_logits = self.model(image)
             letter_probs = torch.softmax(letter_logits, dim=1)
@@ -33,3 +35,26 @@ class Predictor:
 
             letter = index_to_letter[letter_idx]
             return letter, bonus_idx, letter_conf, bonus_conf
+
+    def predict_board(self, tiles):
+        """
+        Classify a whole board in one batched forward pass.
+        `tiles` is a row-major list of tile crops, or the cropped board as a
+        PIL image or (H, W, 3) array.
+        Returns (letters, bonus_idxs, letter_confs, bonus_confs); letters is a
+        list of str, the rest are NumPy arrays with one entry per tile.
+        """
+        batch = self.transform(tiles)
+        with torch.no_grad():
+            letter_logits, bonus_logits = self.model(batch)
+            letter_conf, letter_idx = torch.softmax(letter_logits, dim=1).max(dim=1)
+            bonus_conf, bonus_idx = torch.softmax(bonus_logits, dim=1).max(dim=1)
+
+        letter_idx = letter_idx.cpu().numpy()
+        letters = [index_to_letter[i] for i in letter_idx.tolist()]
+        return (
+            letters,
+            bonus_idx.cpu().numpy(),
+            letter_conf.cpu().numpy(),
+            bonus_conf.cpu().numpy(),
+        )
@@ -1,58 +1,84 @@
 # score_optimizer.py
 
-from typing import List, Tuple, Set, Dict
+from typing import List, Tuple, Dict, Optional
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, wait
+import atexit
+import heapq
 import itertools
+import time
 
-# ---- Letter scores akin to Scrabble ----
-LETTER_SCORES: Dict[str, int] = {
-    **dict.fromkeys("EAIONRTLSU", 1),
-    **dict.fromkeys("DG", 2),
-    **dict.fromkeys("BCMP", 3),
-    **dict.fromkeys("FHVWY", 4),
-    "K": 5,
-    **dict.fromkeys("JX", 8),
-    **dict.fromkeys("QZ", 10)
-}
+from solver.scoring import word_score
+
+# points for using every tile at least once
+COVERAGE_BONUS = 100
+
+def _points(
+    paths: List[Tuple[str, List[Tuple[int, int]]]],
+    scores: Optional[Dict[str, int]] = None
+) -> List[int]:
+    """
+    Points per word: the solver's modifier-aware score from `scores` (as
+    returned by BoggleSolver.find_all_words) when given, else word_score.
+    """
+    if scores is None:
+        return [word_score(w) for w, _ in paths]
+    return [scores[w] if w in scores else word_score(w) for w, _ in paths]
 
-def word_score(word: str) -> int:
+def path_mask(path: List[Tuple[int, int]], grid_size: int = 4) -> int:
     """
-    Compute the base score of a word, with a length bonus:
-      - 3 letters = ×1
-      - 4+ letters = ×(length−2)
+    Bitmask of the tiles a path touches (bit r*grid_size + c).
     """
-    base = sum(LETTER_SCORES.get(ch, 0) for ch in word.upper())
-    length_bonus = 1 if len(word) == 3 else max(1, len(word) - 2)
-    return base * length_bonus
+    mask = 0
+    for r, c in path:
+        mask |= 1 << (r * grid_size + c)
+    return mask
+
+def _lazy_greedy(gains: List, gain_fn, limit: int):
+    """
+    Yield indices in greedy order of gain_fn(i), ties going to the lowest
+    index, given that gains only ever shrink as picks are made. `gains`
+    holds the initial gains; entries whose gain_fn returns None are dropped.
+    The caller updates whatever state gain_fn reads after each yield.
+    """
+    heap = [(-g, i) for i, g in enumerate(gains)]
+    heapq.heapify(heap)
+    picked = 0
+    while heap and picked < limit:
+        neg, i = heapq.heappop(heap)
+        g = gain_fn(i)
+        if g is None:
+            continue
+        if g == -neg:
+            picked += 1
+            yield i
+        else:
+            heapq.heappush(heap, (-g, i))
 
 def optimize_word_order(
-    paths: List[Tuple[str, List[Tuple[int, int]]]]
+    paths: List[Tuple[str, List[Tuple[int, int]]]],
+    scores: Optional[Dict[str, int]] = None,
+    grid_size: int = 4
 ) -> List[Tuple[str, List[Tuple[int, int]]]]:
     """
     Greedily order words by (score + coverage bonus) to maximize points and new tiles.
     """
-    used: Set[str] = set()
+    pts = _points(paths, scores)
+    order = sorted(range(len(paths)), key=lambda i: -pts[i])
+    remaining = [paths[i] for i in order]
+    points = [pts[i] for i in order]
+    masks = [path_mask(p, grid_size) for _, p in remaining]
+    covered = 0
+
+    def gain(i):
+        return points[i] + 2 * (masks[i] & ~covered).bit_count()  # reward for covering new tiles
+
     best_order: List[Tuple[str, List[Tuple[int, int]]]] = []
-    covered_tiles: Set[Tuple[int, int]] = set()
-    remaining = sorted(paths, key=lambda x: -word_score(x[0]))
-
-    while remaining:
-        best_word = None
-        best_gain = -1
-        for word, path in remaining:
-            new_tiles = set(path) - covered_tiles
-            bonus = len(new_tiles) * 2  # reward for covering new tiles
-            gain = word_score(word) + bonus
-            if gain > best_gain:
-                best_gain = gain
-                best_word = (word, path)
-        if not best_word:
-            break
-        best_order.append(best_word)
-        covered_tiles |= set(best_word[1])
-        remaining.remove(best_word)
+    for i in _lazy_greedy([gain(i) for i in range(len(remaining))], gain, len(remaining)):
+        best_order.append(remaining[i])
+        covered |= masks[i]
 
-    all_tiles = {(r, c) for r in range(4) for c in range(4)}
-    if covered_tiles == all_tiles:
+    if covered == (1 << (grid_size * grid_size)) - 1:
         print("\n🎉 All tiles covered — +100 point bonus!")
 
     return best_order
@@ -66,30 +92,24 @@ def ensure_tile_coverage(
     List[Tuple[str, List[Tuple[int, int]]]]
 ]:
     """
-    Phase 1: select up to max_words that maximize new‐tile coverage.
+    Phase 1: select up to max_words that maximize new‐tile coverage.
     Returns (coverage_list, remaining_list).
     """
-    all_tiles = {(r, c) for r in range(grid_size) for c in range(grid_size)}
-    covered: Set[Tuple[int, int]] = set()
-    coverage: List[Tuple[str, List[Tuple[int, int]]]] = []
-    remaining = paths.copy()
+    all_tiles = (1 << (grid_size * grid_size)) - 1
+    masks = [path_mask(p, grid_size) for _, p in paths]
+    covered = 0
 
-    for _ in range(max_words):
-        if covered == all_tiles:
-            break
-        best = None
-        best_new = -1
-        for word, path in remaining:
-            new_tiles = set(path) - covered
-            if len(new_tiles) > best_new:
-                best, best_new = (word, path), len(new_tiles)
-        if not best or best_new == 0:
+    def gain(i):
+        return (masks[i] & ~covered).bit_count()
+
+    chosen: List[int] = []
+    for i in _lazy_greedy([m.bit_count() for m in masks], gain, max_words):
+        if covered == all_tiles or gain(i) == 0:
             break
-        coverage.append(best)
-        covered |= set(best[1])
-        remaining.remove(best)
+        chosen.append(i)
+        covered |= masks[i]
 
-    return coverage, remaining
+    return _split(paths, chosen)
 
 def ensure_efficient_coverage(
     paths: List[Tuple[str, List[Tuple[int, int]]]],
@@ -98,45 +118,181 @@ def ensure_efficient_coverage(
     time_per_tile: float = 0.15,
     overhead_per_word: float = 0.5,
     lambda_eff: float = 1.0,
-    lambda_cov: float = 2.0
+    lambda_cov: float = 2.0,
+    scores: Optional[Dict[str, int]] = None
 ) -> Tuple[
     List[Tuple[str, List[Tuple[int, int]]]],
     List[Tuple[str, List[Tuple[int, int]]]]
 ]:
     """
-    Phase 1: Greedily pick up to max_words maximizing:
+    Phase 1: Greedily pick up to max_words maximizing:
       lambda_eff * (points / est_time) + lambda_cov * new_tile_count
+    Words that add no new tiles are never picked. lambda_cov must be
+    non-negative (gains may only shrink as tiles get covered).
     Returns (selected, remaining).
     """
-    all_tiles = {(r, c) for r in range(grid_size) for c in range(grid_size)}
-    covered: Set[Tuple[int, int]] = set()
-    selected: List[Tuple[str, List[Tuple[int, int]]]] = []
-    remaining = paths.copy()
+    chosen = _efficient_selection(
+        _word_features(paths, grid_size, scores), grid_size, max_words,
+        time_per_tile, overhead_per_word, lambda_eff, lambda_cov,
+    )
+    return _split(paths, chosen)
+
+def _word_features(paths, grid_size: int, scores: Optional[Dict[str, int]] = None):
+    """
+    Per-word (scores, path lengths, tile masks), computed once and reused
+    by every parameter combination.
+    """
+    return (
+        _points(paths, scores),
+        [len(p) for _, p in paths],
+        [path_mask(p, grid_size) for _, p in paths],
+    )
+
+def _efficient_selection(
+    features,
+    grid_size: int,
+    max_words: int,
+    time_per_tile: float,
+    overhead_per_word: float,
+    lambda_eff: float,
+    lambda_cov: float,
+) -> List[int]:
+    scores, lengths, masks = features
+    all_tiles = (1 << (grid_size * grid_size)) - 1
+    effs = [
+        pts / (overhead_per_word + length * time_per_tile)
+        for pts, length in zip(scores, lengths)
+    ]
+    covered = 0
+
+    def gain(i):
+        cov = (masks[i] & ~covered).bit_count()
+        if not cov:
+            return None
+        return lambda_eff * effs[i] + lambda_cov * cov
 
-    for _ in range(max_words):
+    initial = [lambda_eff * e + lambda_cov * m.bit_count() for e, m in zip(effs, masks)]
+    chosen: List[int] = []
+    for i in _lazy_greedy(initial, gain, max_words):
+        chosen.append(i)
+        covered |= masks[i]
         if covered == all_tiles:
             break
-        best_score = -float("inf")
-        best_word = None
-        for word, path in remaining:
-            new_tiles = set(path) - covered
-            if not new_tiles:
-                continue
-            pts = word_score(word)
-            est_time = overhead_per_word + len(path) * time_per_tile
-            eff = pts / est_time
-            cov = len(new_tiles)
-            score = lambda_eff * eff + lambda_cov * cov
-            if score > best_score:
-                best_score = score
-                best_word = (word, path)
-        if not best_word:
+    return chosen
+
+def _split(paths, chosen: List[int]):
+    taken = set(chosen)
+    return (
+        [paths[i] for i in chosen],
+        [p for i, p in enumerate(paths) if i not in taken],
+    )
+
+def _ranking_key(time_per_tile, overhead_per_word, lambda_eff, lambda_cov):
+    """
+    Combinations with equal keys rank every word identically, so they pick
+    the same words: scaling lambda_eff*pts/(overhead + n*tpt) + lambda_cov*cov
+    by 1/lambda_cov leaves (lambda_eff/(lambda_cov*tpt), overhead/tpt).
+    """
+    if lambda_cov > 0 and time_per_tile > 0:
+        return (
+            round(lambda_eff / (lambda_cov * time_per_tile), 9),
+            round(overhead_per_word / time_per_tile, 9),
+        )
+    return (time_per_tile, overhead_per_word, lambda_eff, lambda_cov)
+
+# parameters ensure_efficient_coverage uses when tuning evaluated nothing
+DEFAULT_COVERAGE_PARAMS = {
+    "time_per_tile": 0.15,
+    "overhead_per_word": 0.5,
+    "lambda_eff": 1.0,
+    "lambda_cov": 2.0,
+}
+
+def _tuner_job(job):
+    # a chunk stops at stop_at (wall clock, comparable across processes) so
+    # workers are free again once the caller's budget has run out
+    (features, grid_size, max_words), chunk, stop_at = job
+    selections = []
+    for n, params in chunk:
+        if stop_at is not None and time.time() >= stop_at:
             break
-        selected.append(best_word)
-        covered |= set(best_word[1])
-        remaining.remove(best_word)
+        selections.append((n, tuple(_efficient_selection(features, grid_size, max_words, *params))))
+    return selections
+
+def _expected_points(order, points, times, masks, all_tiles: int, coverage_bonus: int) -> float:
+    """
+    Points of playing `order` when the round ends at a uniformly random
+    moment before the last word finishes: each word (and the coverage
+    bonus, once every tile is used) counts with the fraction of that time
+    still left when it completes. Equivalently, the points finished within
+    a play-time budget, averaged over all budgets.
+    """
+    total_time = sum(times[i] for i in order)
+    if total_time <= 0:
+        return 0.0
+    elapsed, covered, got = 0.0, 0, 0.0
+    for i in order:
+        elapsed += times[i]
+        left = total_time - elapsed
+        got += points[i] * left
+        if covered != all_tiles:
+            covered |= masks[i]
+            if covered == all_tiles:
+                got += coverage_bonus * left
+    return got / total_time
+
+class TunerPool:
+    """
+    Persistent process pool for tune_coverage_params, so a tuning call
+    costs shipping the word features to the workers rather than starting
+    processes (which alone can exceed the runner's tuning budget).
+
+        with TunerPool(4) as pool:
+            best = tune_coverage_params(paths, time_budget=0.05, pool=pool)
+    """
 
-    return selected, remaining
+    def __init__(self, processes: int):
+        self.processes = processes
+        self.executor = ProcessPoolExecutor(max_workers=processes)
+
+    def select(self, state, combos, timeout: Optional[float] = None) -> Dict[int, Tuple[int, ...]]:
+        # {combo index: selection} for the combinations finished in time;
+        # several chunks per worker so a timeout keeps most of the work
+        size = max(1, -(-len(combos) // (self.processes * 4)))
+        indexed = list(enumerate(combos))
+        stop_at = None if timeout is None else time.time() + timeout
+        futures = [
+            self.executor.submit(_tuner_job, (state, indexed[i:i+size], stop_at))
+            for i in range(0, len(indexed), size)
+        ]
+        done, pending = wait(futures, timeout=timeout)
+        for f in pending:
+            f.cancel()
+        return {n: sel for f in done for n, sel in f.result()}
+
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+_TUNER_POOLS: Dict[int, TunerPool] = {}
+
+def get_tuner_pool(processes: int) -> TunerPool:
+    # shared warm pool behind tune_coverage_params(workers=...)
+    pool = _TUNER_POOLS.get(processes)
+    if pool is None:
+        pool = _TUNER_POOLS[processes] = TunerPool(processes)
+    return pool
+
+@atexit.register
+def close_tuner_pools():
+    for pool in _TUNER_POOLS.values():
+        pool.close()
+    _TUNER_POOLS.clear()
 
 def tune_coverage_params(
     paths: List[Tuple[str, List[Tuple[int, int]]]],
@@ -146,33 +302,79 @@ def tune_coverage_params(
     overhead_choices=(0.2, 0.5, 0.8),
     lambda_eff_choices=(0.5, 1.0, 2.0),
     lambda_cov_choices=(1.0, 2.0, 3.0),
+    time_budget: Optional[float] = None,
+    workers: int = 1,
+    scores: Optional[Dict[str, int]] = None,
+    pool: Optional[TunerPool] = None,
+    tile_delay: float = 0.15,
+    word_delay: float = 0.3,
+    input_pause: float = 0.1,
+    coverage_bonus: int = COVERAGE_BONUS,
 ) -> dict:
     """
-    Grid‑search over parameter choices to maximize total points.
-    Returns the best parameter set (and its total score).
+    Grid‑search over parameter choices for the play order (the selected
+    words, then the rest) that scores the most early in the round: a
+    combination's score is its expected points when the round may end at
+    any moment (see _expected_points), timed with word_play_time.
+    Combinations that rank words identically are evaluated once, and
+    per-word features are computed once for the whole search.
+    time_budget (seconds) stops the search early and keeps the best found
+    so far; combinations are evaluated in `pool`, or with workers > 1 in a
+    shared warm TunerPool. `scores` optionally maps words to the solver's
+    points.
+    Returns the best parameter set (and its score). If the budget
+    ran out before any combination finished, DEFAULT_COVERAGE_PARAMS are
+    returned with a score of None.
     """
+    start = time.perf_counter()
+
     # Pre‑sort by score to feed into coverage
-    scored = optimize_word_order(paths)
-    best_params = {"score": -1}
+    scored = optimize_word_order(paths, scores, grid_size)
+    features = _word_features(scored, grid_size, scores)
+    points, _, masks = features
+    times = [word_play_time(p, tile_delay, word_delay, input_pause) for _, p in scored]
+    all_tiles = (1 << (grid_size * grid_size)) - 1
 
-    for tpt, overhead, le, lc in itertools.product(
+    combos, seen = [], set()
+    for params in itertools.product(
         time_per_tile_choices,
         overhead_choices,
         lambda_eff_choices,
         lambda_cov_choices,
     ):
-        cov, rest = ensure_efficient_coverage(
-            scored,
-            grid_size=grid_size,
-            max_words=max_words,
-            time_per_tile=tpt,
-            overhead_per_word=overhead,
-            lambda_eff=le,
-            lambda_cov=lc,
-        )
-        final = cov + rest
-        total_pts = sum(word_score(w) for w, _ in final)
+        key = _ranking_key(*params)
+        if key not in seen:
+            seen.add(key)
+            combos.append(params)
+
+    def remaining_time():
+        if time_budget is None:
+            return None
+        return max(0.0, time_budget - (time.perf_counter() - start))
+
+    selections: Dict[int, Tuple[int, ...]] = {}
+    if pool is None and workers > 1 and len(combos) > 1:
+        pool = get_tuner_pool(workers)
+    if pool is not None:
+        selections = pool.select((features, grid_size, max_words), combos, remaining_time())
+    else:
+        for n, params in enumerate(combos):
+            if n and remaining_time() == 0.0:
+                break
+            selections[n] = tuple(_efficient_selection(features, grid_size, max_words, *params))
+
+    # identical selections score identically
+    totals: Dict[Tuple[int, ...], float] = {}
+    best_params = {"score": -1}
+    for n in sorted(selections):
+        chosen = selections[n]
+        if chosen not in totals:
+            taken = set(chosen)
+            order = list(chosen) + [i for i in range(len(scored)) if i not in taken]
+            totals[chosen] = round(_expected_points(order, points, times, masks, all_tiles, coverage_bonus), 3)
+        total_pts = totals[chosen]
         if total_pts > best_params["score"]:
+            tpt, overhead, le, lc = combos[n]
             best_params = {
                 "score": total_pts,
                 "time_per_tile": tpt,
@@ -180,6 +382,270 @@ def tune_coverage_params(
                 "lambda_eff": le,
                 "lambda_cov": lc,
             }
+    if not selections:
+        best_params = {"score": None, **DEFAULT_COVERAGE_PARAMS}
 
-    print(f"\n🔧 Best tuning → {best_params}")
+    print(f"\n🔧 Best tuning → {best_params} ({len(selections)}/{len(combos)} combinations evaluated)")
     return best_params
+
+# ---- Exact tile coverage ----
+COVER_NODE_LIMIT = 50_000
+
+def _greedy_cover(masks: List[int], times: List[float], all_tiles: int) -> Optional[List[int]]:
+    """
+    Cheap tile cover: repeatedly take the word with the least play time per
+    newly covered tile. None if the words cannot cover every tile.
+    """
+    covered, chosen = 0, []
+    while covered != all_tiles:
+        best, best_rate = None, float("inf")
+        for i, m in enumerate(masks):
+            new = (m & ~covered).bit_count()
+            if new and times[i] / new < best_rate:
+                best, best_rate = i, times[i] / new
+        if best is None:
+            return None
+        chosen.append(best)
+        covered |= masks[best]
+    return chosen
+
+def min_cost_cover(
+    masks: List[int],
+    costs: List[float],
+    all_tiles: int,
+    node_limit: Optional[int] = COVER_NODE_LIMIT
+) -> Optional[List[int]]:
+    """
+    Exact minimum-cost set cover of the bits in all_tiles by the given word
+    masks. Depth-first branch and bound over the uncovered-tile state: each
+    node branches only on the words covering its hardest uncovered tile
+    (fewest covering words), states already reached at no greater cost are
+    skipped, and nodes are pruned with a cheapest-cost-per-tile lower bound
+    against the greedy cover. node_limit caps the expanded states, returning
+    the best cover found so far: 4x4 boards finish well inside the default,
+    5x5 and 6x6 boards may stop early. Returns word indices, or None if the
+    words cannot cover every tile.
+    """
+    # only the cheapest word per distinct tile set can be in an optimum
+    cheapest: Dict[int, int] = {}
+    for i, m in enumerate(masks):
+        m &= all_tiles
+        if m and (m not in cheapest or costs[i] < costs[cheapest[m]]):
+            cheapest[m] = i
+
+    union = 0
+    for m in cheapest:
+        union |= m
+    if union != all_tiles:
+        return None
+    if not all_tiles:
+        return []
+
+    by_tile: Dict[int, List[Tuple[int, float, int]]] = {}
+    for m, i in cheapest.items():
+        rest = m
+        while rest:
+            bit = rest & -rest
+            by_tile.setdefault(bit, []).append((m, costs[i], i))
+            rest ^= bit
+    rate = min(costs[i] / m.bit_count() for m, i in cheapest.items())
+    # try the best cost-per-tile words first so good covers are found early
+    for options in by_tile.values():
+        options.sort(key=lambda o: o[1] / o[0].bit_count())
+
+    greedy = _greedy_cover(masks, costs, all_tiles)
+    best_cost = sum(costs[i] for i in greedy) + 1e-9
+    best = greedy
+    reached: Dict[int, float] = {}
+    chosen: List[int] = []
+    nodes = 0
+
+    def search(uncovered: int, cost: float):
+        nonlocal best_cost, best, nodes
+        if not uncovered:
+            if cost < best_cost:
+                best_cost, best = cost, list(chosen)
+            return
+        if reached.get(uncovered, float("inf")) <= cost:
+            return
+        reached[uncovered] = cost
+        nodes += 1
+        if node_limit is not None and nodes > node_limit:
+            return
+
+        if cost + uncovered.bit_count() * rate >= best_cost:
+            return
+        # branch on the uncovered tile with the fewest covering words
+        branch = None
+        rest = uncovered
+        while rest:
+            bit = rest & -rest
+            rest ^= bit
+            if branch is None or len(by_tile[bit]) < len(by_tile[branch]):
+                branch = bit
+        for m, c, i in by_tile[branch]:
+            chosen.append(i)
+            search(uncovered & ~m, cost + c)
+            chosen.pop()
+
+    search(all_tiles, 0.0)
+    return best
+
+def ensure_exact_coverage(
+    paths: List[Tuple[str, List[Tuple[int, int]]]],
+    grid_size: int = 4,
+    tile_delay: float = 0.15,
+    word_delay: float = 0.3,
+    input_pause: float = 0.1
+) -> Tuple[
+    List[Tuple[str, List[Tuple[int, int]]]],
+    List[Tuple[str, List[Tuple[int, int]]]]
+]:
+    """
+    Phase 1: the words covering every tile in the least play time (see
+    word_play_time), or no words if the board cannot be fully covered.
+    Returns (coverage_list, remaining_list).
+    """
+    masks = [path_mask(p, grid_size) for _, p in paths]
+    times = [word_play_time(p, tile_delay, word_delay, input_pause) for _, p in paths]
+    cover = min_cost_cover(masks, times, (1 << (grid_size * grid_size)) - 1)
+    return _split(paths, cover or [])
+
+# ---- Deadline-aware play order ----
+# play times are sums of float delays: a plan that exactly fills the
+# deadline must compare as fitting despite rounding in the subtractions
+TIME_EPS = 1e-6
+
+def word_play_time(
+    path: List[Tuple[int, int]],
+    tile_delay: float = 0.15,
+    word_delay: float = 0.3,
+    input_pause: float = 0.1
+) -> float:
+    """
+    Seconds play_boggle spends on one word: a tile delay after mouseDown,
+    after every further tile and after mouseUp, then the word delay. Every
+    pyautogui call (a moveTo per tile, mouseDown and mouseUp) also sleeps
+    for pyautogui.PAUSE, passed as input_pause.
+    """
+    return (len(path) + 1) * tile_delay + (len(path) + 2) * input_pause + word_delay
+
+def _knapsack(
+    values: List[int],
+    weights: List[float],
+    capacity: float,
+    node_limit: int
+) -> Tuple[int, List[int]]:
+    """
+    0/1 knapsack by depth-first branch and bound over items in decreasing
+    value density, pruned with the fractional (Dantzig) bound. Starts from
+    the greedy fill and stops after node_limit nodes, returning the best
+    (value, item indices) found.
+    """
+    items = [i for i in range(len(values)) if weights[i] <= capacity + TIME_EPS]
+    items.sort(key=lambda i: -values[i] / weights[i])
+    v = [values[i] for i in items]
+    w = [weights[i] for i in items]
+    n = len(items)
+
+    # prefix sums make the fractional bound a bisection
+    cum_w, cum_v = [0.0], [0]
+    for vi, wi in zip(v, w):
+        cum_w.append(cum_w[-1] + wi)
+        cum_v.append(cum_v[-1] + vi)
+
+    def upper_bound(k, cap, val):
+        j = bisect_right(cum_w, cum_w[k] + cap + TIME_EPS, k) - 1
+        bound = val + cum_v[j] - cum_v[k]
+        if j < n:
+            bound += v[j] * (cap - (cum_w[j] - cum_w[k])) / w[j]
+        return bound
+
+    best_val, best = 0, []
+    cap = capacity
+    for k in range(n):
+        if w[k] <= cap + TIME_EPS:
+            cap -= w[k]
+            best_val += v[k]
+            best.append(k)
+
+    # nodes form a tree of (parent, item) links so no node copies its set
+    parent: List[int] = []
+    item: List[int] = []
+    best_node = None
+    stack = [(0, capacity, 0, -1)]
+    expanded = 0
+    while stack and expanded < node_limit:
+        k, cap, val, node = stack.pop()
+        expanded += 1
+        if val > best_val:
+            best_val, best_node = val, node
+        if k == n or upper_bound(k, cap, val) <= best_val:
+            continue
+        stack.append((k + 1, cap, val, node))
+        if w[k] <= cap + TIME_EPS:
+            parent.append(node)
+            item.append(k)
+            stack.append((k + 1, cap - w[k], val + v[k], len(item) - 1))
+
+    if best_node is not None:
+        best = []
+        while best_node >= 0:
+            best.append(item[best_node])
+            best_node = parent[best_node]
+    return best_val, [items[k] for k in best]
+
+def optimize_for_deadline(
+    paths: List[Tuple[str, List[Tuple[int, int]]]],
+    deadline: float,
+    tile_delay: float = 0.15,
+    word_delay: float = 0.3,
+    input_pause: float = 0.1,
+    grid_size: int = 4,
+    coverage_bonus: int = COVERAGE_BONUS,
+    node_limit: int = 5000,
+    scores: Optional[Dict[str, int]] = None
+) -> Tuple[List[Tuple[str, List[Tuple[int, int]]]], int]:
+    """
+    Choose the words to play in the `deadline` seconds left in the round,
+    maximizing total score including the full-coverage bonus, under the
+    play_boggle timing model (see word_play_time).
+
+    Two plans are compared: the best knapsack over all words, and the
+    fastest full-tile cover plus the best knapsack over the time it leaves. The
+    chosen words are returned in decreasing points-per-second order (so a
+    misjudged deadline costs the least), together with the expected score.
+    Pass the solver's points as `scores` to plan with modifier-aware scores.
+    """
+    points = _points(paths, scores)
+    times = [word_play_time(p, tile_delay, word_delay, input_pause) for _, p in paths]
+    masks = [path_mask(p, grid_size) for _, p in paths]
+    all_tiles = (1 << (grid_size * grid_size)) - 1
+
+    def plan_score(chosen):
+        covered = 0
+        for i in chosen:
+            covered |= masks[i]
+        bonus = coverage_bonus if covered == all_tiles else 0
+        return sum(points[i] for i in chosen) + bonus
+
+    _, chosen = _knapsack(points, times, deadline, node_limit)
+    best_score = plan_score(chosen)
+
+    cover = min_cost_cover(masks, times, all_tiles)
+    if cover is not None:
+        cover_time = sum(times[i] for i in cover)
+        if cover_time <= deadline + TIME_EPS:
+            taken = set(cover)
+            rest = [i for i in range(len(paths)) if i not in taken]
+            _, picked = _knapsack(
+                [points[i] for i in rest], [times[i] for i in rest],
+                deadline - cover_time, node_limit,
+            )
+            plan = cover + [rest[k] for k in picked]
+            total = plan_score(plan)
+            if total > best_score:
+                best_score, chosen = total, plan
+
+    chosen.sort(key=lambda i: -points[i] / times[i])
+    return [paths[i] for i in chosen], best_score
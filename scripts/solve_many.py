@@ -0,0 +1,157 @@
+# solve_many.py
+#
+# Bulk board analysis and solver throughput benchmark. Solves a batch of
+# boards with one engine and reports throughput, latency percentiles,
+# words found and peak memory, so engines and builds can be compared
+# before they go to the bot machines.
+#
+#   python scripts/solve_many.py --count 2000 --engine dawg
+#   python scripts/solve_many.py --file boards.txt --engine bitboard --json
+#   python scripts/solve_many.py --count 5000 --processes 8
+#
+# Board files hold one board per line, either whitespace-separated tiles
+# ("a b qu d ...") or one string of letters where "qu" is a single tile;
+# the grid size is the square root of the tile count. Blank lines and lines
+# starting with '#' are skipped.
+
+import argparse
+import json
+import random
+import string
+import sys
+import time
+from math import isqrt
+from typing import List, Optional
+
+from solver.boggle_game_engine import (
+    BoggleSolver, SolverPool, BOGGLE_DICE, ENGINES, GRID_SIZE,
+    generate_random_board, load_engine_dictionary,
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def parse_board(line: str) -> List[List[str]]:
+    tiles = line.lower().split()
+    if len(tiles) == 1:
+        word, tiles, i = tiles[0], [], 0
+        while i < len(word):
+            step = 2 if word.startswith("qu", i) else 1
+            tiles.append(word[i:i+step])
+            i += step
+    size = isqrt(len(tiles))
+    if size * size != len(tiles):
+        raise ValueError(f"{len(tiles)} tiles do not make a square board: {line!r}")
+    return [tiles[r*size:(r+1)*size] for r in range(size)]
+
+def read_boards(path: str) -> List[List[List[str]]]:
+    with open(path, encoding="utf-8") as f:
+        return [
+            parse_board(line) for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+def random_boards(count: int, size: int, seed: Optional[int]) -> List[List[List[str]]]:
+    random.seed(seed)
+    # sizes without a standard dice set roll uniform letters
+    dice = BOGGLE_DICE.get(size) or [string.ascii_lowercase] * (size * size)
+    return [generate_random_board(dice, size) for _ in range(count)]
+
+def peak_rss_mb() -> Optional[float]:
+    # peak resident set size of this process and its finished children
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+def no_modifiers(board: List[List[str]]) -> List[List[str]]:
+    return [["normal"] * len(board) for _ in board]
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    # nearest-rank percentile of an ascending list
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+def solve_many(
+    boards: List[List[List[str]]],
+    engine: str = "dawg",
+    processes: int = 1,
+    path_criterion: str = "score",
+) -> dict:
+    """
+    Solve every board and return a stats dict. With processes > 1 boards
+    are solved in a SolverPool and per-board latencies are not measured.
+    """
+    t0 = time.perf_counter()
+    load_engine_dictionary(engine)
+    load_time = time.perf_counter() - t0
+
+    latencies: List[float] = []
+    words = 0
+    start = time.perf_counter()
+    if processes > 1:
+        with SolverPool(engine, processes) as pool:
+            jobs = ((b, no_modifiers(b)) for b in boards)
+            for found in pool.solve_many(jobs, path_criterion):
+                words += len(found)
+    else:
+        for board in boards:
+            t = time.perf_counter()
+            found = BoggleSolver(
+                board, no_modifiers(board), engine=engine, path_criterion=path_criterion,
+            ).find_all_words()
+            latencies.append(time.perf_counter() - t)
+            words += len(found)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "engine": engine,
+        "boards": len(boards),
+        "processes": processes,
+        "load_s": round(load_time, 4),
+        "elapsed_s": round(elapsed, 4),
+        "boards_per_s": round(len(boards) / elapsed, 2) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+        "words": words,
+        "words_per_board": round(words / len(boards), 2) if boards else 0,
+        "peak_rss_mb": round(peak_rss_mb(), 1) if resource is not None else None,
+    }
+
+def print_report(stats: dict):
+    print(f"\n📊 {stats['boards']} boards with the {stats['engine']} engine ({stats['processes']} process(es))")
+    print(f"  dictionary load : {stats['load_s']:.3f}s")
+    print(f"  total           : {stats['elapsed_s']:.3f}s → {stats['boards_per_s']} boards/s")
+    if stats["p50_ms"] is not None:
+        print(f"  latency         : p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+    print(f"  words found     : {stats['words']} ({stats['words_per_board']} per board)")
+    rss = stats["peak_rss_mb"]
+    print(f"  peak RSS        : {f'{rss:.1f} MB' if rss is not None else 'n/a on this platform'}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve many boards and report solver throughput")
+    parser.add_argument("--engine", choices=ENGINES, default="dawg", help="Solver engine")
+    parser.add_argument("--file", help="Read boards from this file instead of rolling random ones")
+    parser.add_argument("--count", type=int, default=1000, help="Number of random boards")
+    parser.add_argument("--size", type=int, default=GRID_SIZE, help="Grid size of random boards")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for reproducible boards")
+    parser.add_argument("--processes", type=int, default=1, help="Solve in a warm process pool")
+    parser.add_argument("--criterion", default="score", help="Best-path criterion (score, travel, coverage)")
+    parser.add_argument("--json", action="store_true", help="Print the stats as one JSON object")
+    args = parser.parse_args()
+
+    boards = read_boards(args.file) if args.file else random_boards(args.count, args.size, args.seed)
+    stats = solve_many(boards, args.engine, args.processes, args.criterion)
+    if args.json:
+        print(json.dumps(stats))
+    else:
+        print_report(stats)
@@ -0,0 +1,346 @@
+# board_store.py
+#
+# Per-board candidate word sets for batch analysis (see
+# boggle_batch_cache.py) in one SQLite file instead of one pickle per board;
+# the live solver does not read them. Rows are keyed by (board hash,
+# dictionary version) and hold the candidate word ids of that compiled
+# dictionary as a compressed id list, so a lookup is one indexed read and
+# the whole cache is a single file that can be copied between machines.
+#
+# Id lists are stored as the gaps between ascending ids, split into byte
+# planes (all low bytes, then all high bytes) and deflated:
+#
+#   width   1 byte     bytes per gap (2, or 4 if a gap is >= 65536)
+#   planes  zlib       width planes of len(ids) bytes each
+#
+# Candidate ids are dense enough that gaps mostly fit a byte, so the high
+# plane is nearly all zeros and compresses away: a typical 4x4 board takes
+# ~2 KB against ~10 KB of raw uint32 ids (~24 KB as a pickled word list),
+# and decoding is a zlib inflate plus a cumulative sum.
+#
+# Every process opens its own connection (reopened after a fork) and the
+# database runs in WAL mode with a busy timeout, so the batch cache's pool
+# workers can all write to the same store. A board's candidates only depend
+# on the board and the dictionary version, so ids are never rewritten.
+#
+# The store can be capped by total bytes and/or entries. Each row tracks a
+# hit count and last-use time; lookups are buffered in memory and written
+# with the next insert (or every FLUSH_EVERY lookups), so a hit costs no
+# write. The row count and byte total are kept as running counters, updated
+# in the same transaction as every insert and delete, so each insert checks
+# the limits with two key lookups. An insert that goes over a limit evicts
+# rows, least recently used ('lru') or least frequently used ('lfu') first,
+# down to LOW_WATER of the limits before it commits; the store never holds
+# more than its limits, however many processes write to it. Rows for other
+# dictionary versions can never hit again and are always evicted first.
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+BUSY_TIMEOUT_S = 30.0
+STORE_FORMAT = 4  # PRAGMA user_version; stores in another format are emptied
+COMPRESS_LEVEL = 6
+POLICIES = ("lru", "lfu")
+FLUSH_EVERY = 256
+LOW_WATER = 0.9
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS boards (
+        key       TEXT NOT NULL,
+        version   TEXT NOT NULL,
+        board     TEXT,
+        ids       BLOB NOT NULL,
+        size      INTEGER NOT NULL,
+        hits      INTEGER NOT NULL DEFAULT 0,
+        last_used REAL NOT NULL,
+        PRIMARY KEY (key, version)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS counters (
+        name  TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )
+    """,
+    # eviction walks rows in policy order without sorting the table
+    "CREATE INDEX IF NOT EXISTS boards_lru ON boards (last_used)",
+    "CREATE INDEX IF NOT EXISTS boards_lfu ON boards (hits, last_used)",
+)
+_EVICTION_ORDER = {
+    "lru": "last_used",
+    "lfu": "hits, last_used",
+}
+
+
+def encode_ids(ids: Iterable[int]) -> bytes:
+    ids = np.unique(np.asarray(ids, dtype=np.int64))
+    gaps = np.diff(ids, prepend=0)
+    width = 2 if not len(gaps) or gaps.max() < 1 << 16 else 4
+    planes = gaps.astype(f'<u{width}').view(np.uint8).reshape(-1, width).T
+    return bytes([width]) + zlib.compress(planes.tobytes(), COMPRESS_LEVEL)
+
+
+def decode_ids(blob: bytes) -> np.ndarray:
+    # ascending uint32 ids
+    width = blob[0]
+    planes = np.frombuffer(zlib.decompress(blob[1:]), dtype=np.uint8).reshape(width, -1)
+    gaps = planes[0].astype(np.uint32)
+    for b in range(1, width):
+        gaps |= planes[b].astype(np.uint32) << (8 * b)
+    return np.cumsum(gaps, dtype=np.uint32)
+
+
+class BoardStore:
+    def __init__(
+        self,
+        path: str,
+        version: str,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        policy: str = "lru",
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown eviction policy {policy!r}, expected one of {POLICIES}")
+        self.path = path
+        self.version = version
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.policy = policy
+        # lookups by this process since it opened the store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = None
+        self._pid = None
+        self._reset_pending()
+
+    def _reset_pending(self):
+        # lookups not yet written: key -> (hits, last use), plus counter deltas
+        self._pending: Dict[str, Tuple[int, float]] = {}
+        self._pending_hits = 0
+        self._pending_misses = 0
+        self._lookups = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        # a connection must not cross a fork, so each process opens its own
+        if self._db is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_S, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            # the write lock makes the format check safe against other processes
+            db.execute("BEGIN IMMEDIATE")
+            if db.execute("PRAGMA user_version").fetchone()[0] != STORE_FORMAT:
+                db.execute("DROP TABLE IF EXISTS boards")
+                db.execute("DROP TABLE IF EXISTS counters")
+                db.execute(f"PRAGMA user_version = {STORE_FORMAT}")
+            for statement in _SCHEMA:
+                db.execute(statement)
+            db.commit()
+            if self._pid != os.getpid():
+                # pending lookups were inherited from the parent, which writes them
+                self._reset_pending()
+            self._db, self._pid = db, os.getpid()
+        return self._db
+
+    def _flush(self, db: sqlite3.Connection):
+        # write buffered lookups; the caller holds the lock and a transaction
+        if self._pending:
+            db.executemany(
+                "UPDATE boards SET hits = hits + ?, last_used = MAX(last_used, ?) "
+                "WHERE key = ? AND version = ?",
+                [(n, t, key, self.version) for key, (n, t) in self._pending.items()],
+            )
+        self._bump(db, hits=self._pending_hits, misses=self._pending_misses)
+        self._pending.clear()
+        self._pending_hits = self._pending_misses = 0
+
+    @staticmethod
+    def _bump(db: sqlite3.Connection, **deltas):
+        db.executemany(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            [(name, n) for name, n in deltas.items() if n],
+        )
+
+    def flush(self):
+        with self._lock:
+            db = self._conn()
+            with db:
+                self._flush(db)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            row = self._conn().execute(
+                "SELECT ids FROM boards WHERE key = ? AND version = ?", (key, self.version)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                self._pending_misses += 1
+            else:
+                self.hits += 1
+                self._pending_hits += 1
+                n, _ = self._pending.get(key, (0, 0.0))
+                self._pending[key] = (n + 1, time.time())
+            self._lookups += 1
+            if self._lookups % FLUSH_EVERY == 0:
+                with self._db:
+                    self._flush(self._db)
+        return None if row is None else decode_ids(row[0])
+
+    def put(self, key: str, ids: Iterable[int], board: Optional[str] = None) -> bool:
+        # False if the board was already stored (by this or another process)
+        blob = encode_ids(ids)
+        size = len(blob) + len(board or '') + len(key)
+        with self._lock:
+            db = self._conn()
+            with db:
+                cur = db.execute(
+                    "INSERT OR IGNORE INTO boards (key, version, board, ids, size, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, self.version, board, blob, size, time.time()),
+                )
+                if cur.rowcount == 1:
+                    self._bump(db, entries=1, bytes=size)
+                self._flush(db)
+                if self._over_limits(db):
+                    self._evict(
+                        db,
+                        None if self.max_bytes is None else int(self.max_bytes * LOW_WATER),
+                        None if self.max_entries is None else int(self.max_entries * LOW_WATER),
+                        self.policy,
+                    )
+        return cur.rowcount == 1
+
+    def _usage(self, db: sqlite3.Connection) -> Tuple[int, int]:
+        # (rows, bytes) of every version, from the running counters
+        totals = dict(db.execute("SELECT name, value FROM counters WHERE name IN ('entries', 'bytes')"))
+        return totals.get("entries", 0), totals.get("bytes", 0)
+
+    def _over_limits(self, db: sqlite3.Connection) -> bool:
+        entries, size = self._usage(db)
+        return ((self.max_entries is not None and entries > self.max_entries)
+                or (self.max_bytes is not None and size > self.max_bytes))
+
+    def _evict(self, db: sqlite3.Connection, max_bytes: Optional[int],
+               max_entries: Optional[int], policy: str) -> Tuple[int, int]:
+        # (rows, bytes) removed; the caller holds the lock and a transaction
+        stale = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM boards WHERE version != ?", (self.version,)
+        ).fetchone()
+        db.execute("DELETE FROM boards WHERE version != ?", (self.version,))
+        removed, freed = stale
+
+        entries, size = self._usage(db)
+        entries, size = entries - removed, size - freed
+        victims = []
+        rows = db.execute(f"SELECT key, size FROM boards ORDER BY {_EVICTION_ORDER[policy]}")
+        for key, row_size in rows:
+            if ((max_entries is None or entries <= max_entries)
+                    and (max_bytes is None or size <= max_bytes)):
+                break
+            victims.append((key, self.version))
+            entries -= 1
+            size -= row_size
+            freed += row_size
+        rows.close()
+        db.executemany("DELETE FROM boards WHERE key = ? AND version = ?", victims)
+        removed += len(victims)
+        self._bump(db, evictions=removed, entries=-removed, bytes=-freed)
+        return removed, freed
+
+    def evict(self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None,
+              policy: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Evict rows until the store holds at most max_bytes / max_entries
+        (this store's limits when both are None) and return the number of
+        rows and bytes removed. Rows for other dictionary versions are
+        always removed.
+        """
+        if max_bytes is None and max_entries is None:
+            max_bytes, max_entries = self.max_bytes, self.max_entries
+        policy = policy or self.policy
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown eviction policy {policy!r}, expected one of {POLICIES}")
+        with self._lock:
+            db = self._conn()
+            with db:
+                self._flush(db)
+                return self._evict(db, max_bytes, max_entries, policy)
+
+    def vacuum(self):
+        # give the pages freed by eviction back to the file system
+        with self._lock:
+            db = self._conn()
+            with db:
+                self._flush(db)
+            db.execute("VACUUM")
+
+    def stats(self) -> dict:
+        with self._lock:
+            db = self._conn()
+            with db:
+                self._flush(db)
+            entries, size = self._usage(db)
+            current = db.execute(
+                "SELECT COUNT(*) FROM boards WHERE version = ?", (self.version,)
+            ).fetchone()[0]
+            counters = dict(db.execute("SELECT name, value FROM counters"))
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        files = [self.path + suffix for suffix in ("", "-wal", "-shm")]
+        return {
+            "path": self.path,
+            "entries": entries,
+            "stale_entries": entries - current,
+            "bytes": size,
+            "file_bytes": sum(os.path.getsize(f) for f in files if os.path.exists(f)),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+            "evictions": counters.get("evictions", 0),
+            "policy": self.policy,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+        }
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._conn().execute(
+                "SELECT 1 FROM boards WHERE key = ? AND version = ?", (key, self.version)
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn().execute(
+                "SELECT COUNT(*) FROM boards WHERE version = ?", (self.version,)
+            ).fetchone()[0]
+
+    def keys(self) -> Set[str]:
+        with self._lock:
+            rows = self._conn().execute(
+                "SELECT key FROM boards WHERE version = ?", (self.version,)
+            ).fetchall()
+        return {k for (k,) in rows}
+
+    def close(self):
+        # fold the WAL back into the main file so the store is one file again
+        with self._lock:
+            if self._db is not None and self._pid == os.getpid():
+                with self._db:
+                    self._flush(self._db)
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
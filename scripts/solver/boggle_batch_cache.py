@@ -1,24 +1,23 @@
 import os
 import time
 import argparse
+import glob
 import pickle
 import random
 from typing import List
-from collections import Counter
 from multiprocessing import Pool, cpu_count
 from tqdm import tqdm
-from boggle_game_engine import generate_random_board, load_dictionary, is_word_possible, board_hash
+from boggle_game_engine import (
+    BOARD_STORE_PATH, generate_random_board, load_dictionary, candidate_ids, board_hash, board_text,
+    get_board_store,
+)
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-CACHE_DIR = os.path.join(BASE_DIR, ".boggle_cache")
-LOG_FILE = os.path.join(BASE_DIR, "logs")
+# the engine's store, which get_board_store() and cached_candidate_ids read
+STORE_PATH = BOARD_STORE_PATH
 
-# Load previously cached board hashes from log file
-def load_cached_hashes(log_path: str) -> set:
-    if not os.path.exists(log_path):
-        return set()
-    with open(log_path, "r") as f:
-        return {line.split(" -> ")[0] for line in f if "->" in line}
+# Load previously cached board hashes from the store
+def load_cached_hashes(store_path: str) -> set:
+    return get_board_store(store_path).keys()
 
 # Generate unique random boards
 def generate_unique_boards(limit: int, exclude: set) -> List[List[List[str]]]:
@@ -34,30 +33,29 @@ def generate_unique_boards(limit: int, exclude: set) -> List[List[List[str]]]:
                 pbar.update(1)
     return boards
 
-# Cache one board to file if not already cached
+# Cache one board in the store if not already cached
 def cache_single_board(board: List[List[str]]):
+    store = get_board_store(STORE_PATH)
     hash_key = board_hash(board)
-    cache_file = os.path.join(CACHE_DIR, f"{hash_key}.pkl")
+    if hash_key in store:
+        return 0
+    return int(store.put(hash_key, candidate_ids(board), board_text(board)))
 
-    if not os.path.exists(cache_file):
-        all_words = load_dictionary()
-        board_counter = Counter(ch for row in board for ch in row)
-        filtered = [word for word in all_words if is_word_possible(word, board_counter)]
-
-        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
-        with open(cache_file, 'wb') as f:
-            pickle.dump(filtered, f)
-
-        os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-        with open(LOG_FILE, 'a') as log:
-            log.write(f"{hash_key} -> {board}\n")
-
-        return 1
-    return 0
+# Move old one-pickle-per-board caches (lists of words) into the store
+def import_pickles(pickle_dir: str) -> int:
+    store = get_board_store(STORE_PATH)
+    word_ids = {w: i for i, w in enumerate(load_dictionary())}
+    imported = 0
+    for path in tqdm(sorted(glob.glob(os.path.join(pickle_dir, "*.pkl"))), desc="Importing pickles"):
+        with open(path, 'rb') as f:
+            words = pickle.load(f)
+        # words missing from the current dictionary can't be expressed as ids
+        ids = sorted(word_ids[w] for w in words if w in word_ids)
+        imported += store.put(os.path.splitext(os.path.basename(path))[0], ids)
+    return imported
 
 # Batch process all boards with multiprocessing and progress
 def batch_cache_boards(boards: List[List[List[str]]]):
-    os.makedirs(CACHE_DIR, exist_ok=True)
     start = time.time()
     total_cached = 0
 
@@ -65,6 +63,7 @@ def batch_cache_boards(boards: List[List[List[str]]]):
         for result in tqdm(pool.imap_unordered(cache_single_board, boards), total=len(boards), desc="Caching boards"):
             total_cached += result
 
+    get_board_store(STORE_PATH).close()
     elapsed = time.time() - start
     avg_time = elapsed / max(total_cached, 1)
 
@@ -74,14 +73,20 @@ def batch_cache_boards(boards: List[List[List[str]]]):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Cache random Boggle boards")
     parser.add_argument("--count", type=int, default=10000, help="Number of unique boards to cache")
+    parser.add_argument("--import-pickles", metavar="DIR", help="Import a directory of old <hash>.pkl caches and exit")
     args = parser.parse_args()
 
-    already_cached = load_cached_hashes(LOG_FILE)
-    print(f"Found {len(already_cached)} cached boards. Target: {args.count}")
-    needed = max(0, args.count - len(already_cached))
-
-    if needed == 0:
-        print("All requested boards already cached.")
+    if args.import_pickles:
+        n = import_pickles(args.import_pickles)
+        get_board_store(STORE_PATH).close()
+        print(f"✅ Imported {n} boards into {STORE_PATH}")
     else:
-        boards = generate_unique_boards(needed, already_cached)
-        batch_cache_boards(boards)
+        already_cached = load_cached_hashes(STORE_PATH)
+        print(f"Found {len(already_cached)} cached boards. Target: {args.count}")
+        needed = max(0, args.count - len(already_cached))
+
+        if needed == 0:
+            print("All requested boards already cached.")
+        else:
+            boards = generate_unique_boards(needed, already_cached)
+            batch_cache_boards(boards)
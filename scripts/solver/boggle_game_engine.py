@@ -2,28 +2,41 @@
 
 import os
 import hashlib
-import pickle
-from typing import List, Tuple, Dict
-from collections import Counter
-
-# ---- Letter values like Scrabble ----
-LETTER_POINTS: Dict[str, int] = {
-    'a': 1, 'b': 3, 'c': 3, 'd': 2,
-    'e': 1, 'f': 4, 'g': 2, 'h': 4,
-    'i': 1, 'j': 8, 'k': 5, 'l': 1,
-    'm': 3, 'n': 1, 'o': 1, 'p': 3,
-    'q': 10, 'r': 1, 's': 1, 't': 1,
-    'u': 1, 'v': 4, 'w': 4, 'x': 8,
-    'y': 4, 'z': 10
-}
+import signal
+import multiprocessing
+from functools import lru_cache
+from math import isqrt
+from typing import List, Tuple, Dict, Optional, Iterator
+
+try:
+    from .packed_trie import PackedTrie, load_or_build, END
+    from .compiled_dict import CompiledDictionary, load_or_build as load_or_build_compiled
+    from .board_store import BoardStore
+    from .scoring import (
+        LETTER_POINTS, normalize_modifier, length_multiplier, tile_values,
+    )
+except ImportError:
+    from packed_trie import PackedTrie, load_or_build, END
+    from compiled_dict import CompiledDictionary, load_or_build as load_or_build_compiled
+    from board_store import BoardStore
+    from scoring import (
+        LETTER_POINTS, normalize_modifier, length_multiplier, tile_values,
+    )
 
 GRID_SIZE = 4
+ENGINES = ("stack", "bitboard", "packed", "dawg")
+MIN_WORD_LENGTH = 3
 TRIE_CACHE_DIR = ".trie_cache"
-DICT_CACHE_DIR = ".boggle_cache"
 DICT_PATH = os.path.join("data", "twl06.txt")
-
-os.makedirs(TRIE_CACHE_DIR, exist_ok=True)
-os.makedirs(DICT_CACHE_DIR, exist_ok=True)
+# the board store is shared by every script, so it is anchored at the repo
+# root rather than the working directory
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DICT_CACHE_DIR = os.path.join(BASE_DIR, ".boggle_cache")
+BOARD_STORE_PATH = os.path.join(DICT_CACHE_DIR, "boards.sqlite")
+# the board store evicts down to these limits (None = unlimited); see board_store.py
+BOARD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+BOARD_CACHE_MAX_ENTRIES = None
+BOARD_CACHE_POLICY = "lru"
 
 class TrieNode:
     __slots__ = ('children', 'word')
@@ -35,25 +48,147 @@ def board_hash(board: List[List[str]]) -> str:
     flat = ''.join(ch for row in board for ch in row)
     return hashlib.md5(flat.encode()).hexdigest()
 
-def load_dictionary(min_length: int = 3) -> List[str]:
+def read_dictionary(min_length: int = 3) -> List[str]:
+    # parse the text word list; only used to (re)build the compiled copy
     with open(DICT_PATH, encoding='utf-8') as f:
         return [w.strip().lower() for w in f if len(w.strip()) >= min_length]
 
-def get_or_cache_filtered_words(board: List[List[str]]) -> List[str]:
+@lru_cache(maxsize=None)
+def dictionary_digest() -> str:
+    # identifies the dictionary version every on-disk artifact is built from
+    with open(DICT_PATH, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+# ---- Compiled dictionary ----
+# The word list compiled once per dictionary version and memory-mapped;
+# every caller in the process shares the same instance.
+_COMPILED: Dict[int, CompiledDictionary] = {}
+
+def get_compiled_dictionary(min_length: int = 3) -> CompiledDictionary:
+    cd = _COMPILED.get(min_length)
+    if cd is None:
+        digest = dictionary_digest()
+        path = os.path.join(TRIE_CACHE_DIR, f"{digest}.{min_length}.cdict")
+        cd = _COMPILED[min_length] = load_or_build_compiled(
+            path, digest, lambda: read_dictionary(min_length)
+        )
+    return cd
+
+def load_dictionary(min_length: int = 3) -> List[str]:
+    # shared list: callers must not mutate it
+    return get_compiled_dictionary(min_length).words()
+
+# ---- Candidate filtering ----
+# A word is only worth searching for if the board has enough of each of its
+# letters. The check runs against the compiled dictionary's letter-count
+# matrix and yields word ids.
+def board_letter_counts(board: List[List[str]]) -> List[int]:
+    # letters on the board as 26 counts for 'a'..'z' ('qu' counts a q and a u)
+    counts = [0] * 26
+    for row in board:
+        for tile in row:
+            for ch in tile.lower():
+                if 'a' <= ch <= 'z':
+                    counts[ord(ch) - 97] += 1
+    return counts
+
+def candidate_ids(board: List[List[str]], min_length: int = 3):
+    # ids in the compiled dictionary of the words the board has the letters for
+    return get_compiled_dictionary(min_length).feasible_ids(board_letter_counts(board))
+
+# ---- Board store ----
+# Candidate ids per board, cached in one SQLite file per store path. This is
+# a batch-analysis artifact (filled by boggle_batch_cache.py, read back with
+# cached_candidate_ids / get_or_cache_filtered_words); BoggleSolver never
+# reads it. The DFS already prunes the shared resident trie to the board's
+# letters, and that is ~9x faster than building a per-board trie from the
+# cached candidates (~2 ms vs ~16 ms per 4x4 board).
+_BOARD_STORES: Dict[str, BoardStore] = {}
+
+def get_board_store(path: str = BOARD_STORE_PATH) -> BoardStore:
+    store = _BOARD_STORES.get(path)
+    if store is None:
+        store = _BOARD_STORES[path] = BoardStore(
+            path, dictionary_digest(),
+            BOARD_CACHE_MAX_BYTES, BOARD_CACHE_MAX_ENTRIES, BOARD_CACHE_POLICY,
+        )
+    return store
+
+def board_text(board: List[List[str]]) -> str:
+    # row-major tiles separated by spaces, the format solve_many reads
+    return ' '.join(ch for row in board for ch in row)
+
+def cached_candidate_ids(board: List[List[str]]):
+    store = get_board_store()
     key = board_hash(board)
-    cache_file = os.path.join(DICT_CACHE_DIR, f"{key}.pkl")
-    if os.path.exists(cache_file):
-        return pickle.load(open(cache_file, 'rb'))
+    ids = store.get(key)
+    if ids is None:
+        ids = candidate_ids(board)
+        store.put(key, ids, board_text(board))
+    return ids
+
+def get_or_cache_filtered_words(board: List[List[str]]) -> List[str]:
     full = load_dictionary()
-    counts = Counter(ch for row in board for ch in row)
-    filtered = [w for w in full if all(w.count(ch) <= counts[ch] for ch in set(w))]
-    with open(cache_file, 'wb') as f:
-        pickle.dump(filtered, f)
-    return filtered
+    return [full[i] for i in cached_candidate_ids(board).tolist()]
+
+# ---- Path selection ----
+# A word is often spelled by several paths. Workers keep one per word, the
+# best under a criterion: a key(points, path, size) function where higher
+# keys win and earlier paths win ties. Only the incumbent is stored, so the
+# choice costs a key comparison per repeated word.
+SQRT2 = 2 ** 0.5
+
+def path_travel(path: List[int], size: int = GRID_SIZE) -> float:
+    # mouse travel in tile widths: 1 per straight step, sqrt(2) per diagonal
+    d = 0.0
+    for a, b in zip(path, path[1:]):
+        d += 1.0 if a // size == b // size or a % size == b % size else SQRT2
+    return d
+
+def _by_score(points: int, path: List[int], size: int):
+    return points, -path_travel(path, size)
+
+def _by_travel(points: int, path: List[int], size: int):
+    return -path_travel(path, size), points
+
+def _by_coverage(points: int, path: List[int], size: int):
+    # corner and edge tiles have fewer neighbors, so fewer words pass
+    # through them: prefer paths that cover those hard-to-reach tiles
+    masks = neighbor_masks(size)
+    return sum(8 - masks[i].bit_count() for i in path), points
+
+PATH_CRITERIA = {"score": _by_score, "travel": _by_travel, "coverage": _by_coverage}
+
+def resolve_criterion(path_criterion):
+    # a PATH_CRITERIA name or a key(points, path, size) function
+    if callable(path_criterion):
+        return path_criterion
+    if path_criterion in PATH_CRITERIA:
+        return PATH_CRITERIA[path_criterion]
+    raise ValueError(f"Unknown path criterion {path_criterion!r}, expected one of {tuple(PATH_CRITERIA)}")
+
+def _keep(found, word: str, points: int, path: List[int], better, size: int) -> None:
+    # `path` must be a fresh list; it is stored as-is
+    old = found.get(word)
+    if old is None or better(points, path, size) > better(old[0], old[1], size):
+        found[word] = (points, path)
+
+def _merge(parts, better, size: int) -> Dict[str, Tuple[int, List[Tuple[int,int]]]]:
+    # merge per-start-tile results with the criterion the workers used and
+    # convert tile indices to (row, col)
+    combined: Dict[str, Tuple[int, List[int]]] = {}
+    for part in parts:
+        for w, (pts, path) in part.items():
+            _keep(combined, w, pts, path, better, size)
+    return {
+        w: (pts, [divmod(i, size) for i in path])
+        for w, (pts, path) in combined.items()
+    }
 
 def _dfs_worker(args):
-    start, B, M, neighbors, trie_root = args
+    start, B, M, neighbors, trie_root, better = args
     found: Dict[str, Tuple[int, List[int]]] = {}
+    size = isqrt(len(B))
 
     # initialize for start position
     ch0 = B[start]
@@ -81,7 +216,7 @@ def _dfs_worker(args):
 
     score0 = ls
     if node.word:
-        found[node.word] = (score0*wmul0, [start])
+        found[node.word] = (score0*wmul0*length_multiplier(len(node.word)), [start])
 
     # DFS stack
     stack = [(start, node, 1<<start, score0, wmul0, [start])]
@@ -114,46 +249,245 @@ def _dfs_worker(args):
             sc2 += ls2
             new_path = path + [nxt]
 
-            if node2.word and node2.word not in found:
-                found[node2.word] = (sc2*wm2, new_path[:])
+            if node2.word:
+                _keep(found, node2.word, sc2*wm2*length_multiplier(len(node2.word)), new_path, better, size)
 
             stack.append((nxt, node2, vis | (1<<nxt), sc2, wm2, new_path))
 
     return found
 
+# ---- Bitboard engine ----
+# Tiles are bit positions (r*size + c) and the visited set is an int mask
+# (a Python int, so any grid size fits). Per board, each tile gets a tuple
+# of its usable neighbors as (tile, bit, letter code, second letter code,
+# letter points, word multiplier): modifiers are pre-folded and letters are
+# integer codes into the letter-indexed trie below, so the hot loop only
+# unpacks tuples and indexes lists.
+
+@lru_cache(maxsize=None)
+def neighbor_masks(size: int = GRID_SIZE) -> Tuple[int, ...]:
+    masks = []
+    for r in range(size):
+        for c in range(size):
+            m = 0
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    if dr or dc:
+                        rr, cc = r+dr, c+dc
+                        if 0 <= rr < size and 0 <= cc < size:
+                            m |= 1 << (rr*size + cc)
+            masks.append(m)
+    return tuple(masks)
+
+NEIGHBOR_MASKS = neighbor_masks()
+
+# Letter-indexed trie: a node is a list with the word ending there (or
+# None) in slot WORD and the children for 'a'..'z' in slots 1..26, so a step
+# is one list index by letter code instead of a dict lookup. Leaves are
+# one-slot lists [word]; the root always has all 27 slots.
+WORD = 0
+LETTER_CODES = {chr(ord('a') + i): i + 1 for i in range(26)}
+
+def build_indexed_trie(words: List[str]) -> list:
+    root = [None] * 27
+    no_children = (None,) * 26
+    for w in words:
+        node = root
+        try:
+            for ch in w:
+                if len(node) == 1:
+                    node.extend(no_children)  # a leaf gets its first child
+                child = node[LETTER_CODES[ch]]
+                if child is None:
+                    child = node[LETTER_CODES[ch]] = [None]
+                node = child
+        except KeyError:
+            continue  # not a-z: no board can spell it
+        node[WORD] = w
+    return root
+
+def tile_codes(tiles: List[str]) -> Tuple[List[int], List[int], int]:
+    # (first letter codes, second letter codes or 0, mask of tiles that no
+    # word can use: not one or two letters a-z, e.g. an unclassified tile)
+    first, second, dead = [], [], 0
+    for i, ch in enumerate(tiles):
+        a = LETTER_CODES.get(ch[:1], 0)
+        b = LETTER_CODES.get(ch[1:], 0) if len(ch) == 2 else 0
+        if not a or len(ch) > 2 or (len(ch) == 2 and not b):
+            dead |= 1 << i
+        first.append(a)
+        second.append(b)
+    return first, second, dead
+
+def tile_adjacency(masks, first, second, dead, letter_pts, word_mul) -> Tuple[tuple, ...]:
+    # per tile, its neighbors in ascending order, minus tiles no word can use
+    return tuple(
+        tuple(
+            (j, 1 << j, first[j], second[j], letter_pts[j], word_mul[j])
+            for j in range(len(masks)) if (m & ~dead) >> j & 1
+        )
+        for m in masks
+    )
+
+def _bitboard_worker(args):
+    start, first, second, dead, letter_pts, word_mul, adjacency, trie_root, better = args
+    found: Dict[str, Tuple[int, List[int]]] = {}
+    size = isqrt(len(adjacency))
+    if dead >> start & 1:
+        return found
+
+    node = trie_root[first[start]]
+    if node is not None and second[start]:
+        node = node[second[start]] if len(node) > 1 else None
+    if node is None:
+        return found
+
+    sc0, wm0 = letter_pts[start], word_mul[start]
+    if node[WORD]:
+        found[node[WORD]] = (sc0*wm0*length_multiplier(len(node[WORD])), [start])
+    if len(node) == 1:
+        return found
+
+    # Explicit stack, no recursion: a tile records every child's word as it
+    # is scanned and pushes the children that can extend further, which are
+    # then popped last-to-first. This visits words in exactly the order of
+    # the stack engine, so ties between paths resolve identically.
+    stack = [(start, node, 1 << start, sc0, wm0, [start])]
+    while stack:
+        pos, nd, vis, sc, wm, path = stack.pop()
+        for nxt, low, c, c2, pts, mul in adjacency[pos]:
+            if vis & low:
+                continue
+            node2 = nd[c]
+            if node2 is None:
+                continue
+            if c2:
+                if len(node2) == 1:
+                    continue
+                node2 = node2[c2]
+                if node2 is None:
+                    continue
+
+            word = node2[WORD]
+            if word:
+                points = (sc + pts)*wm*mul*length_multiplier(len(word))
+                if word in found:
+                    _keep(found, word, points, path + [nxt], better, size)
+                else:
+                    found[word] = (points, path + [nxt])
+            if len(node2) > 1:
+                stack.append((nxt, node2, vis | low, sc + pts, wm * mul, path + [nxt]))
+    return found
+
+def _packed_worker(args):
+    start, B, first, second, letter_pts, word_mul, masks, trie, min_len, better = args
+    letters, links, ends = trie.letters, trie.links, trie.ends
+    found: Dict[str, Tuple[int, List[int]]] = {}
+    size = isqrt(len(masks))
+
+    # same visiting order as _bitboard_worker (recursive, over neighbor
+    # masks), but nodes are record indices into the packed columns and words
+    # are spelled from the path when emitted
+    p = letters.find(first[start], 0, ends[0])
+    if p < 0:
+        return found
+    node = links[p]
+    if second[start]:
+        p = letters.find(second[start], node, ends[node])
+        if p < 0:
+            return found
+        node = links[p]
+
+    sc0, wm0 = letter_pts[start], word_mul[start]
+    if letters[node] == END and len(B[start]) >= min_len:
+        found[B[start]] = (sc0*wm0*length_multiplier(len(B[start])), [start])
+
+    path = [start]
+
+    def expand(pos, nd, vis, sc, wm):
+        children = []
+        cand = masks[pos] & ~vis
+        while cand:
+            low = cand & -cand
+            cand ^= low
+            nxt = low.bit_length() - 1
+
+            p = letters.find(first[nxt], nd, ends[nd])
+            if p < 0:
+                continue
+            node2 = links[p]
+            if second[nxt]:
+                p = letters.find(second[nxt], node2, ends[node2])
+                if p < 0:
+                    continue
+                node2 = links[p]
+
+            sc2 = sc + letter_pts[nxt]
+            wm2 = wm * word_mul[nxt]
+            if letters[node2] == END:
+                word = ''.join([B[i] for i in path]) + B[nxt]
+                if len(word) >= min_len:
+                    _keep(found, word, sc2*wm2*length_multiplier(len(word)), path + [nxt], better, size)
+            children.append((nxt, node2, low, sc2, wm2))
+
+        for nxt, node2, low, sc2, wm2 in reversed(children):
+            path.append(nxt)
+            expand(nxt, node2, vis | low, sc2, wm2)
+            path.pop()
+
+    expand(start, node, 1 << start, sc0, wm0)
+    return found
+
 class BoggleSolver:
     def __init__(
         self,
         board: List[List[str]],
         modifiers: List[List[str]],
-        words: List[str]
+        words: Optional[List[str]] = None,
+        engine: str = "stack",
+        path_criterion="score"
     ):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+        self.engine = engine
+        # square boards of any size: 4x4 Boggle, 5x5 Big Boggle, 6x6 Super Big Boggle
+        self.size = len(board)
+        if any(len(row) != self.size for row in board) or len(modifiers) != self.size \
+                or any(len(row) != self.size for row in modifiers):
+            raise ValueError("board and modifiers must be square grids of the same size")
+        # which path to report when a word can be spelled several ways
+        self.better = resolve_criterion(path_criterion)
         self.B = [ch.lower() for row in board for ch in row]
-        self.M = [mod for row in modifiers for mod in row]
+        # modifiers may be names ('DL') or the classifier's bonus indices
+        self.M = [normalize_modifier(mod) for row in modifiers for mod in row]
+
+        # integer-coded tiles for the bitboard engine ('qu' spans two trie edges)
+        self.first, self.second, self.dead = tile_codes(self.B)
+        self.letter_pts, self.word_mul = tile_values(self.B, self.M)
 
         # neighbors
-        self.neighbors = [[] for _ in range(GRID_SIZE**2)]
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                i = r*GRID_SIZE + c
-                for dr in (-1, 0, 1):
-                    for dc in (-1, 0, 1):
-                        if dr or dc:
-                            rr, cc = r+dr, c+dc
-                            if 0 <= rr < GRID_SIZE and 0 <= cc < GRID_SIZE:
-                                self.neighbors[i].append(rr*GRID_SIZE + cc)
-
-        # build/load trie
-        h = board_hash([
-            self.B[i:i+GRID_SIZE]
-            for i in range(0, GRID_SIZE**2, GRID_SIZE)
-        ])
-        trie_file = os.path.join(TRIE_CACHE_DIR, f"{h}.trie.pkl")
-        if os.path.exists(trie_file):
-            self.trie_root = pickle.load(open(trie_file, 'rb'))
+        self.masks = neighbor_masks(self.size)
+        self.neighbors = [
+            [j for j in range(self.size**2) if m >> j & 1] for m in self.masks
+        ]
+
+        # the DFS only ever follows letters present on the board, so the
+        # shared dictionary trie needs no per-board filtering or caching
+        if engine == "dawg":
+            if words is not None:
+                raise ValueError("the dawg engine always searches the built-in TWL06 dictionary")
+            self.packed = get_dawg()
+        elif engine == "packed":
+            self.packed = get_packed_trie() if words is None else PackedTrie.from_words(words)
+        elif engine == "bitboard":
+            self.trie_root = get_indexed_trie() if words is None else build_indexed_trie(words)
+        elif words is None:
+            self.trie_root = get_shared_trie()
         else:
             self.trie_root = BoggleSolver.build_trie(words)
-            pickle.dump(self.trie_root, open(trie_file, 'wb'))
+        if engine in ("packed", "dawg"):
+            self.first_code = [ch[0].encode() for ch in self.B]
+            self.second_code = [ch[1:].encode() for ch in self.B]
 
     @staticmethod
     def build_trie(words: List[str]) -> TrieNode:
@@ -165,27 +499,223 @@ class BoggleSolver:
             node.word = w
         return root
 
+    def _jobs(self):
+        # (worker, one argument tuple per start tile)
+        if self.engine == "bitboard":
+            worker = _bitboard_worker
+            adjacency = tile_adjacency(
+                self.masks, self.first, self.second, self.dead, self.letter_pts, self.word_mul,
+            )
+            args = [
+                (i, self.first, self.second, self.dead, self.letter_pts,
+                 self.word_mul, adjacency, self.trie_root, self.better)
+                for i in range(self.size**2)
+            ]
+        elif self.engine in ("packed", "dawg"):
+            worker = _packed_worker
+            args = [
+                (i, self.B, self.first_code, self.second_code, self.letter_pts,
+                 self.word_mul, self.masks, self.packed, MIN_WORD_LENGTH,
+                 self.better)
+                for i in range(self.size**2)
+            ]
+        else:
+            worker = _dfs_worker
+            args = [
+                (i, self.B, self.M, self.neighbors, self.trie_root, self.better)
+                for i in range(self.size**2)
+            ]
+        return worker, args
+
     def find_all_words(self) -> Dict[str, Tuple[int, List[Tuple[int,int]]]]:
-        # prepare args
-        args = [
-            (i, self.B, self.M, self.neighbors, self.trie_root)
-            for i in range(GRID_SIZE**2)
-        ]
+        worker, args = self._jobs()
 
         # sequential DFS so KeyboardInterrupt is handled
-        results = list(map(_dfs_worker, args))
+        results = list(map(worker, args))
+
+        # merge start tiles with the same criterion the workers used
+        return _merge(results, self.better, self.size)
+
+    def start_order(self) -> List[int]:
+        # best-first start tiles: a tile's word multiplier times the letter
+        # points within reach of its first step
+        def potential(i):
+            reach = self.letter_pts[i] + sum(self.letter_pts[j] for j in self.neighbors[i])
+            return self.word_mul[i] * reach
+        return sorted(range(self.size**2), key=potential, reverse=True)
+
+    def iter_words(self) -> Iterator[Tuple[str, int, List[Tuple[int,int]]]]:
+        # Streaming find_all_words: yields (word, points, path) one start
+        # tile at a time in start_order(), each tile's words highest points
+        # first. A word is yielded once, with the best path from the first
+        # start tile that spells it.
+        worker, args = self._jobs()
+        seen = set()
+        for i in self.start_order():
+            part = worker(args[i])
+            for w, (pts, path) in sorted(part.items(), key=lambda kv: -kv[1][0]):
+                if w not in seen:
+                    seen.add(w)
+                    yield w, pts, [divmod(j, self.size) for j in path]
+
+# ---- Warm worker pool ----
+# Worker processes load the engine's dictionary once, in the pool
+# initializer (or inherit it over fork), and keep it across jobs. A job is
+# only the board letters, the modifiers and a start tile or whole board;
+# the dictionary is never pickled.
+def load_engine_dictionary(engine: str):
+    if engine == "dawg":
+        return get_dawg()
+    if engine == "packed":
+        return get_packed_trie()
+    if engine == "bitboard":
+        return get_indexed_trie()
+    return get_shared_trie()
+
+def _init_pool_worker(engine: str):
+    # Ctrl-C goes to the parent, which tears the pool down; workers that
+    # also caught it would die mid-job with a traceback each
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    load_engine_dictionary(engine)
+
+def _pool_start_job(job):
+    board, modifiers, engine, criterion, start = job
+    worker, args = BoggleSolver(board, modifiers, engine=engine, path_criterion=criterion)._jobs()
+    return worker(args[start])
 
-        combined: Dict[str, Tuple[int, List[int]]] = {}
-        for part in results:
-            combined.update(part)
+def _pool_board_job(job):
+    board, modifiers, engine, criterion = job
+    return BoggleSolver(board, modifiers, engine=engine, path_criterion=criterion).find_all_words()
 
-        # convert to (row,col)
-        return {
-            w: (pts, [(i//GRID_SIZE, i%GRID_SIZE) for i in path])
-            for w, (pts, path) in combined.items()
-        }
+class SolverPool:
+    """
+    Persistent process pool for multi-core solving.
+
+        with SolverPool("dawg") as pool:
+            words = pool.find_all_words(board, mods)          # start tiles in parallel
+            for words in pool.solve_many(boards_and_mods):    # boards in parallel
+                ...
+
+    path_criterion must be picklable: a PATH_CRITERIA name or a
+    module-level function.
+    """
+
+    def __init__(self, engine: str = "dawg", processes: Optional[int] = None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+        self.engine = engine
+        self.pool = multiprocessing.Pool(
+            processes, initializer=_init_pool_worker, initargs=(engine,)
+        )
+
+    def _run(self, result):
+        try:
+            return result.get()
+        except KeyboardInterrupt:
+            self.terminate()
+            raise
+
+    def find_all_words(
+        self,
+        board: List[List[str]],
+        modifiers: List[List[str]],
+        path_criterion="score"
+    ) -> Dict[str, Tuple[int, List[Tuple[int,int]]]]:
+        better = resolve_criterion(path_criterion)
+        size = len(board)
+        jobs = [(board, modifiers, self.engine, path_criterion, i) for i in range(size**2)]
+        parts = self._run(self.pool.map_async(_pool_start_job, jobs))
+        return _merge(parts, better, size)
+
+    def solve_many(self, boards, path_criterion="score", chunksize: int = 4):
+        # boards: iterable of (board, modifiers); yields find_all_words
+        # results in input order
+        jobs = ((b, m, self.engine, path_criterion) for b, m in boards)
+        it = self.pool.imap(_pool_board_job, jobs, chunksize)
+        try:
+            yield from it
+        except KeyboardInterrupt:
+            self.terminate()
+            raise
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def terminate(self):
+        self.pool.terminate()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+# ---- Process-wide dictionary trie ----
+# Built once from the full dictionary and kept resident across solves.
+_SHARED_TRIES: Dict[int, TrieNode] = {}
+
+def get_shared_trie(min_length: int = 3) -> TrieNode:
+    root = _SHARED_TRIES.get(min_length)
+    if root is None:
+        root = _SHARED_TRIES[min_length] = BoggleSolver.build_trie(load_dictionary(min_length))
+    return root
+
+_INDEXED_TRIES: Dict[int, list] = {}
+
+def get_indexed_trie(min_length: int = 3) -> list:
+    # the bitboard engine's letter-indexed copy of the dictionary trie
+    root = _INDEXED_TRIES.get(min_length)
+    if root is None:
+        root = _INDEXED_TRIES[min_length] = build_indexed_trie(load_dictionary(min_length))
+    return root
+
+# ---- Packed trie on disk ----
+# One memory-mapped file per dictionary version, shared by every process.
+_PACKED_TRIES: Dict[int, PackedTrie] = {}
+
+def get_packed_trie(min_length: int = 3) -> PackedTrie:
+    trie = _PACKED_TRIES.get(min_length)
+    if trie is None:
+        path = os.path.join(TRIE_CACHE_DIR, f"{dictionary_digest()}.{min_length}.ptrie")
+        trie = _PACKED_TRIES[min_length] = load_or_build(
+            path, lambda: load_dictionary(min_length)
+        )
+    return trie
+
+# ---- TWL06 DAWG ----
+# twl.py decodes its DAWG into the same letter/link/run-end record columns
+# as PackedTrie ('$' records mark word ends), so the packed worker can walk
+# it as-is: nothing to build and nothing to load from disk.
+def get_dawg():
+    import twl
+    return twl._DAWG
+
+# ---- Random boards ----
+# Standard dice, one list of faces per die ('qu' is a single face).
+BOGGLE_DICE: Dict[int, List[List[str]]] = {
+    4: [d.split() for d in (
+        "a a e e g n", "a b b j o o", "a c h o p s", "a f f k p s",
+        "a o o t t w", "c i m o t u", "d e i l r x", "d e l r v y",
+        "d i s t t y", "e e g h n w", "e e i n s u", "e h r t v w",
+        "e i o s s t", "e l r t t y", "h i m n qu u", "h l n n r z",
+    )],
+    5: [d.split() for d in (
+        "a a a f r s", "a a e e e e", "a a f i r s", "a d e n n n", "a e e e e m",
+        "a e e g m u", "a e g m n n", "a f i r s y", "b j k qu x z", "c c e n s t",
+        "c e i i l t", "c e i l p t", "c e i p s t", "d d h n o t", "d h h l o r",
+        "d h l n o r", "d h l n o r", "e i i i t t", "e m o t t t", "e n s s s u",
+        "f i p r s y", "g o r r v w", "i p r r r y", "n o o t u w", "o o o t t u",
+    )],
+}
 
-def generate_random_board(dice: List[str]) -> List[List[str]]:
+def generate_random_board(dice: List[str], size: int = GRID_SIZE) -> List[List[str]]:
+    # roll size*size of the dice (each a string or list of faces) into a
+    # random size x size board
     import random
-    sel = [random.choice(d) for d in random.sample(dice, len(dice))]
-    return [sel[i:i+GRID_SIZE] for i in range(0, GRID_SIZE**2, GRID_SIZE)]
+    sel = [random.choice(d) for d in random.sample(dice, size*size)]
+    return [sel[i:i+size] for i in range(0, size*size, size)]
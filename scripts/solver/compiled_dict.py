@@ -0,0 +1,157 @@
+# compiled_dict.py
+#
+# The word list compiled into one memory-mapped file, so loading the
+# dictionary is an mmap instead of reading and stripping the text file.
+#
+#   offsets[i]    uint32     start of word i in the blob (n + 1 entries)
+#   lengths[i]    uint8      length of word i
+#   counts        uint8      26 columns of n: occurrences of 'a' + c in each word
+#   blob          ascii      the words joined by '\n', in source order
+#
+# The columns are stored back to back (offsets first, so they stay 4-byte
+# aligned) followed by a trailer that records the source digest: a file is
+# only reused for the exact dictionary it was compiled from, and `version`
+# identifies that dictionary to anything keyed by word ids.
+#
+# The letter counts are an (n_words, 26) uint8 matrix stored column by
+# column, viewed straight from the mapped bytes. Finding the words a
+# multiset of letters can spell (feasible_ids) is one vectorized comparison
+# per scarce letter over a contiguous column, instead of a Python loop per
+# word.
+
+import os
+import sys
+import mmap
+import struct
+from array import array
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+_MAGIC = b'CDIC'
+_VERSION = 2
+_TRAILER = struct.Struct('<4sII32sc3x')  # magic, format version, n_words, source digest, byteorder
+
+ALPHABET = 26
+
+
+class CompiledDictionary:
+    __slots__ = ('offsets', 'lengths', 'counts', 'blob', 'version', '_words', '_matrix', '_max', '_mm')
+
+    def __init__(self, offsets, lengths, counts, blob, version: str, mm=None):
+        self.offsets = offsets
+        self.lengths = lengths
+        self.counts = counts
+        self.blob = blob
+        self.version = version
+        self._words = None
+        self._matrix = None
+        self._max = None
+        self._mm = mm
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def word(self, i: int) -> str:
+        return bytes(self.blob[self.offsets[i]:self.offsets[i] + self.lengths[i]]).decode('ascii')
+
+    def letter_counts(self, i: int) -> bytes:
+        return bytes(self.counts[i::len(self)])
+
+    def words(self) -> List[str]:
+        # decoded once and shared: callers must not mutate the list
+        if self._words is None:
+            self._words = bytes(self.blob).decode('ascii').split('\n') if len(self) else []
+        return self._words
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words())
+
+    def count_matrix(self) -> np.ndarray:
+        # (n_words, 26) uint8 view of the letter counts (column-major), no copy
+        if self._matrix is None:
+            self._matrix = np.frombuffer(self.counts, dtype=np.uint8).reshape(ALPHABET, len(self)).T
+        return self._matrix
+
+    def feasible_ids(self, available) -> np.ndarray:
+        # ids (ascending, uint32) of the words whose letter counts all fit in
+        # `available`, 26 counts for 'a'..'z'
+        available = np.asarray(available, dtype=np.uint8)
+        columns = self.count_matrix().T
+        ok = None
+        # letters available at least as often as any word uses them can't
+        # rule a word out, so only the scarce columns are compared
+        for c in np.flatnonzero(available < self.max_counts()):
+            fits = columns[c] <= available[c]
+            ok = fits if ok is None else np.logical_and(ok, fits, out=ok)
+        if ok is None:
+            return np.arange(len(self), dtype=np.uint32)
+        return np.flatnonzero(ok).astype(np.uint32)
+
+    def max_counts(self) -> np.ndarray:
+        # most copies of each letter in any one word
+        if self._max is None:
+            self._max = (self.count_matrix().max(axis=0) if len(self)
+                         else np.zeros(ALPHABET, dtype=np.uint8))
+        return self._max
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], version: str) -> 'CompiledDictionary':
+        words = list(words)
+        offsets = array('I', [0])
+        lengths = bytearray()
+        n = len(words)
+        counts = bytearray(ALPHABET * n)
+        pos = 0
+        for i, w in enumerate(words):
+            if len(w) > 255 or not w.isascii() or '\n' in w:
+                raise ValueError(f"cannot compile word {w!r}")
+            pos += len(w) + 1
+            offsets.append(pos)
+            lengths.append(len(w))
+            for ch in w:
+                c = ord(ch) - 97
+                if 0 <= c < ALPHABET:
+                    counts[c*n + i] += 1
+        blob = '\n'.join(words).encode('ascii')
+        return cls(offsets, bytes(lengths), bytes(counts), blob, version)
+
+    def save(self, path: str) -> None:
+        n = len(self)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(array('I', self.offsets).tobytes())
+            f.write(bytes(self.lengths))
+            f.write(bytes(self.counts))
+            f.write(bytes(self.blob))
+            f.write(_TRAILER.pack(_MAGIC, _VERSION, n, self.version.encode('ascii'), sys.byteorder[0].encode()))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, version: str) -> 'CompiledDictionary':
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fmt, n, digest, order = _TRAILER.unpack(mm[-_TRAILER.size:])
+        if (magic != _MAGIC or fmt != _VERSION or order != sys.byteorder[0].encode()
+                or digest.decode('ascii') != version):
+            mm.close()
+            raise ValueError(f"{path} is not a compiled copy of this dictionary")
+
+        view = memoryview(mm)[:len(mm) - _TRAILER.size]
+        a = 4 * (n + 1)
+        offsets = view[:a].cast('I')
+        lengths = view[a:a + n]
+        counts = view[a + n:a + n + ALPHABET*n]
+        blob = view[a + n + ALPHABET*n:]
+        return cls(offsets, lengths, counts, blob, version, mm)
+
+
+def load_or_build(path: str, version: str, words_fn) -> CompiledDictionary:
+    if os.path.exists(path):
+        try:
+            return CompiledDictionary.load(path, version)
+        except (ValueError, struct.error):
+            pass
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    CompiledDictionary.from_words(words_fn(), version).save(path)
+    return CompiledDictionary.load(path, version)
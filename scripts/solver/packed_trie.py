@@ -0,0 +1,137 @@
+# packed_trie.py
+#
+# A dictionary trie flattened into three parallel record columns, using the
+# same record model as the DAWG in twl.py: every node is a contiguous run of
+# records sorted by letter, a '$' record first in the run marks a word end,
+# and each letter record links to the first record of its child's run.
+#
+#   letters[i]  uint8   ASCII letter of record i ('$' = end of word)
+#   links[i]    uint32  index of the child's first record
+#   ends[i]     uint32  one past the last record of the run holding i
+#
+# The root is the run starting at record 0. On disk the columns are stored
+# back to back followed by a small trailer, and the file is memory-mapped
+# on load.
+
+import os
+import sys
+import mmap
+import struct
+from array import array
+from collections import deque
+from typing import Iterable
+
+END = ord('$')
+
+_MAGIC = b'PTRI'
+_VERSION = 1
+_TRAILER = struct.Struct('<4sIIc3x')  # magic, version, n_records, byteorder
+
+
+class PackedTrie:
+    __slots__ = ('letters', 'links', 'ends', '_mm')
+
+    def __init__(self, letters, links, ends, mm=None):
+        self.letters = letters
+        self.links = links
+        self.ends = ends
+        self._mm = mm
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def child(self, index: int, letter: str) -> int:
+        p = self.letters.find(letter.encode(), index, self.ends[index])
+        return -1 if p < 0 else self.links[p]
+
+    def __contains__(self, word: str) -> bool:
+        index = 0
+        for ch in word:
+            index = self.child(index, ch)
+            if index < 0:
+                return False
+        return self.letters[index] == END
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> 'PackedTrie':
+        words = sorted(set(words))
+        letters = bytearray()
+        links = array('I')
+        ends = array('I')
+
+        # breadth-first: each queue item is a range of words sharing a
+        # prefix of length `depth`, plus the parent record to link to it
+        queue = deque([(0, len(words), 0, -1)])
+        while queue:
+            lo, hi, depth, parent = queue.popleft()
+            start = len(letters)
+            if parent >= 0:
+                links[parent] = start
+
+            runs = []
+            i = lo
+            if i < hi and len(words[i]) == depth:
+                runs.append((END, i, i))
+                i += 1
+            while i < hi:
+                ch = words[i][depth]
+                j = i + 1
+                while j < hi and words[j][depth] == ch:
+                    j += 1
+                runs.append((ord(ch), i, j))
+                i = j
+
+            end = start + len(runs)
+            for code, a, b in runs:
+                if code != END:
+                    queue.append((a, b, depth + 1, len(letters)))
+                letters.append(code)
+                links.append(0)
+                ends.append(end)
+
+        if not letters:
+            # empty dictionary: a root run with one record that never matches
+            letters.append(0)
+            links.append(0)
+            ends.append(1)
+        return cls(bytes(letters), links, ends)
+
+    def save(self, path: str) -> None:
+        n = len(self)
+        pad = -n % 4
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(bytes(self.letters))
+            f.write(b'\0' * pad)
+            f.write(array('I', self.links).tobytes())
+            f.write(array('I', self.ends).tobytes())
+            f.write(_TRAILER.pack(_MAGIC, _VERSION, n, sys.byteorder[0].encode()))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'PackedTrie':
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n, order = _TRAILER.unpack(mm[-_TRAILER.size:])
+        if magic != _MAGIC or version != _VERSION or order != sys.byteorder[0].encode():
+            mm.close()
+            raise ValueError(f"{path} is not a compatible packed trie")
+
+        a = n + (-n % 4)
+        view = memoryview(mm)
+        links = view[a:a + 4*n].cast('I')
+        ends = view[a + 4*n:a + 8*n].cast('I')
+        # the letter column is small and bytes.find beats mmap.find in the
+        # DFS, so copy it; the two uint32 columns stay zero-copy views
+        return cls(bytes(view[:n]), links, ends, mm)
+
+
+def load_or_build(path: str, words_fn) -> PackedTrie:
+    if os.path.exists(path):
+        try:
+            return PackedTrie.load(path)
+        except (ValueError, struct.error):
+            pass
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    PackedTrie.from_words(words_fn()).save(path)
+    return PackedTrie.load(path)
@@ -0,0 +1,69 @@
+# scoring.py
+#
+# The one place Boggle scores are defined. The solver scores every word
+# while it walks the board, the optimizer and the runner reuse those points,
+# and word_score() gives the same number for an unmodified board.
+#
+#   points = (sum of letter points, each times its DL/TL multiplier)
+#            * (product of DW/TW multipliers on the path)
+#            * length_multiplier(len(word))
+#
+# Scores are computed from per-tile tables (tile_values), so a path's score
+# is a sum and a product over tile indices.
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# ---- Letter values like Scrabble ----
+LETTER_POINTS: Dict[str, int] = {
+    'a': 1, 'b': 3, 'c': 3, 'd': 2,
+    'e': 1, 'f': 4, 'g': 2, 'h': 4,
+    'i': 1, 'j': 8, 'k': 5, 'l': 1,
+    'm': 3, 'n': 1, 'o': 1, 'p': 3,
+    'q': 10, 'r': 1, 's': 1, 't': 1,
+    'u': 1, 'v': 4, 'w': 4, 'x': 8,
+    'y': 4, 'z': 10
+}
+
+# ---- Tile modifiers ----
+# Index order matches model_definitions.bonus_to_index, so the classifier's
+# bonus indices and the modifier names are interchangeable.
+MODIFIERS: Tuple[str, ...] = ("normal", "DL", "TL", "DW", "TW")
+LETTER_MULTIPLIERS: Dict[str, int] = {'DL': 2, 'TL': 3}
+WORD_MULTIPLIERS: Dict[str, int] = {'DW': 2, 'TW': 3}
+
+def normalize_modifier(mod) -> str:
+    # 'DL', 'dl', 2 (a bonus index) or None -> a name from MODIFIERS
+    if mod is None:
+        return "normal"
+    if isinstance(mod, str):
+        name = mod.strip().upper()
+        return name if name in MODIFIERS else "normal"
+    return MODIFIERS[int(mod)]
+
+def length_multiplier(length: int) -> int:
+    # 3 letters = x1, 4+ letters = x(length - 2)
+    return max(1, length - 2)
+
+def tile_values(tiles: List[str], modifiers: List) -> Tuple[List[int], List[int]]:
+    # per-tile (letter points with the letter multiplier folded in, word multiplier)
+    mods = [normalize_modifier(m) for m in modifiers]
+    letter_pts = [
+        sum(LETTER_POINTS.get(c, 0) for c in ch.lower()) * LETTER_MULTIPLIERS.get(mod, 1)
+        for ch, mod in zip(tiles, mods)
+    ]
+    word_mul = [WORD_MULTIPLIERS.get(mod, 1) for mod in mods]
+    return letter_pts, word_mul
+
+def path_score(length: int, path: List[int], letter_pts: List[int], word_mul: List[int]) -> int:
+    # score of a word of `length` letters spelled along tile indices `path`
+    sc, wm = 0, 1
+    for i in path:
+        sc += letter_pts[i]
+        wm *= word_mul[i]
+    return sc * wm * length_multiplier(length)
+
+@lru_cache(maxsize=None)
+def word_score(word: str) -> int:
+    # score of a word on tiles without modifiers
+    return sum(LETTER_POINTS.get(ch, 0) for ch in word.lower()) * length_multiplier(len(word))
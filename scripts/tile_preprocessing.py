@@ -0,0 +1,105 @@
+# tile_preprocessing.py
+#
+# Vectorized board -> tile preprocessing shared by the runner, the tile
+# cropper and the Predictor, so all three produce identical pixels.
+#
+# A frame is converted to a NumPy array once; the grid is sliced as views
+# and every tile is resized and greyscaled in a single batched operation.
+# Both steps reproduce PIL bit for bit: the resize is
+# Image.resize(..., BILINEAR) (what torchvision's Resize does to the PIL
+# images the model is trained on) and the greyscale is PIL's "L" luma.
+
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+GRID_SIZE = 4
+IMG_SIZE = 28
+
+def frame_array(img) -> np.ndarray:
+    # (H, W, 3) uint8; arrays are passed through untouched
+    if isinstance(img, np.ndarray):
+        return img
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return np.asarray(img)
+
+def crop_box(frame: np.ndarray, box) -> np.ndarray:
+    left, top, right, bottom = box
+    return frame[top:bottom, left:right]
+
+def grid_views(board: np.ndarray, grid_size: int = GRID_SIZE) -> np.ndarray:
+    # (grid_size, grid_size, th, tw, 3) tiles indexed [row, col]; a view, no
+    # pixels are copied until the tiles are resized
+    h, w = board.shape[:2]
+    th, tw = h // grid_size, w // grid_size
+    tiles = board[:th*grid_size, :tw*grid_size]
+    return tiles.reshape(grid_size, th, grid_size, tw, -1).swapaxes(1, 2)
+
+# PIL's Resample.c works in fixed point with this many fraction bits
+PRECISION_BITS = 32 - 8 - 2
+
+@lru_cache(maxsize=None)
+def _resize_weights(in_size: int, out_size: int) -> np.ndarray:
+    # (out_size, in_size) triangle-filter weights, computed like PIL's
+    # precompute_coeffs (the filter widens by the scale when downsampling)
+    # and rounded to PRECISION_BITS fixed point like normalize_coeffs_8bpc.
+    # Kept as float64: every product and sum of a pass is an integer below
+    # 2**53, so float matmuls give PIL's integer results exactly.
+    scale = in_size / out_size
+    filterscale = max(scale, 1.0)
+    support = filterscale
+    ss = 1.0 / filterscale
+    weights = np.zeros((out_size, in_size), dtype=np.float64)
+    for o in range(out_size):
+        center = (o + 0.5) * scale
+        lo = max(int(center - support + 0.5), 0)
+        hi = min(int(center + support + 0.5), in_size)
+        k = np.clip(1.0 - np.abs((np.arange(lo, hi) - center + 0.5) * ss), 0.0, None)
+        ww = 0.0
+        for v in k:  # summed in order, like the C loop
+            ww += v
+        if ww != 0.0:
+            k = k / ww
+        weights[o, lo:hi] = np.trunc(k * (1 << PRECISION_BITS) + np.where(k < 0, -0.5, 0.5))
+    return weights
+
+def _round_pass(acc: np.ndarray) -> np.ndarray:
+    # PIL's clip8: add half, shift out the fraction bits, clamp to a byte
+    return np.clip(np.floor((acc + (1 << (PRECISION_BITS - 1))) / (1 << PRECISION_BITS)), 0, 255)
+
+def resize_tiles(tiles: np.ndarray, size) -> np.ndarray:
+    # (..., h, w, c) uint8 -> (..., size[1], size[0], c) uint8; size is (w, h)
+    # like PIL. Horizontal pass first, rounded to bytes, then vertical, as PIL does.
+    out_w, out_h = size
+    h, w = tiles.shape[-3:-1]
+    out = tiles.astype(np.float64)
+    if w != out_w:
+        out = _round_pass(np.einsum("pw,...hwc->...hpc", _resize_weights(w, out_w), out, optimize=True))
+    if h != out_h:
+        out = _round_pass(np.einsum("oh,...hwc->...owc", _resize_weights(h, out_h), out, optimize=True))
+    return out.astype(np.uint8)
+
+def to_gray(tiles: np.ndarray) -> np.ndarray:
+    # PIL "L" conversion: L = (R*19595 + G*38470 + B*7471 + 0x8000) >> 16
+    rgb = tiles.astype(np.uint32)
+    luma = rgb[..., 0] * 19595 + rgb[..., 1] * 38470 + rgb[..., 2] * 7471 + 0x8000
+    return (luma >> 16).astype(np.uint8)
+
+def tiles_to_batch(tiles: np.ndarray, img_size: int = IMG_SIZE) -> np.ndarray:
+    # (..., h, w, 3) uint8 tiles -> (n, 1, img_size, img_size) float32 in [0, 1]
+    small = to_gray(resize_tiles(tiles, (img_size, img_size)))
+    return small.reshape(-1, 1, img_size, img_size).astype(np.float32) / 255.0
+
+def board_batch(board, grid_size: int = GRID_SIZE, img_size: int = IMG_SIZE) -> np.ndarray:
+    # cropped board (PIL image or array) -> ready (grid_size**2, 1, img_size, img_size) batch
+    return tiles_to_batch(grid_views(frame_array(board), grid_size), img_size)
+
+def crops_batch(crops, img_size: int = IMG_SIZE) -> np.ndarray:
+    # list of equally sized PIL tile crops -> (n, 1, img_size, img_size) batch
+    return tiles_to_batch(np.stack([frame_array(c) for c in crops]), img_size)
+
+def tile_images(tiles: np.ndarray):
+    # row-major PIL images from (..., h, w, 3) tiles
+    return [Image.fromarray(t) for t in tiles.reshape(-1, *tiles.shape[-3:])]
@@ -45,6 +45,11 @@ M - More Flag
 L - ASCII Letter (lowercase or '$')
 I - Index (Pointer)
 
+On load the table is viewed as an array of uint32 records (no copy) and
+split once into per-record columns: `letters`/`chars`, `links`, `more`
+and `ends` (one past the last record of each run of siblings). Traversal
+reads these columns directly instead of unpacking records one by one.
+
 The helper method _get_record(index) will extract these three elements
 into a Python tuple such as (True, 'a', 26).
 
@@ -116,10 +121,11 @@ http://en.wikipedia.org/wiki/Official_Tournament_and_Club_Word_List
 http://www.isc.ro/lists/twl06.zip
 '''
 
+import array
 import base64
 import collections
 import itertools
-import struct
+import sys
 import zlib
 
 
@@ -178,58 +184,66 @@ class _Dawg(object):
         data = base64.b64decode(data)
         data = zlib.decompress(data)
         self.data = data
+        self._decode()
+
+    def _decode(self):
+        # Zero-copy uint32 view over the decompressed table, split once
+        # into per-record columns so traversal never calls struct.unpack.
+        if sys.byteorder == 'little':
+            records = memoryview(self.data).cast('I')
+        else:
+            records = array.array('I', self.data)
+            records.byteswap()
+        self.records = records
+        self.letters = bytes([(x >> 24) & 0x7f for x in records])
+        self.chars = self.letters.decode('ascii')
+        self.links = array.array('I', [x & 0xffffff for x in records])
+        self.more = bytes([x >> 31 for x in records])
+
+        # ends[i] is one past the last record of the run containing i
+        n = len(records)
+        ends = array.array('I', [n]) * n
+        end = n
+        more = self.more
+        for i in range(n - 1, -1, -1):
+            if not more[i]:
+                end = i + 1
+            ends[i] = end
+        self.ends = ends
 
     def _get_record(self, index):
-        a = index * 4
-        b = index * 4 + 4
-        x = struct.unpack('<I', self.data[a:b])[0]
-        more = bool(x & 0x80000000)
-        letter = chr((x >> 24) & 0x7f)
-        link = int(x & 0xffffff)
-        return (more, letter, link)
+        return (bool(self.more[index]), self.chars[index], self.links[index])
 
     def _get_child(self, index, letter):
-        while True:
-            more, other, link = self._get_record(index)
-            if other == letter:
-                return link
-            if not more:
-                return None
-            index += 1
+        p = self.chars.find(letter, index, self.ends[index])
+        if p < 0:
+            return None
+        return self.links[p]
 
     def _get_children(self, index):
-        result = []
-        while True:
-            more, letter, link = self._get_record(index)
-            result.append(letter)
-            if not more:
-                break
-            index += 1
-        return result
+        return list(self.chars[index:self.ends[index]])
 
     def _anagram(self, bag, index=0, letters=None):
         letters = letters or []
-        while True:
-            more, letter, link = self._get_record(index)
+        chars, links = self.chars, self.links
+        for i in range(index, self.ends[index]):
+            letter = chars[i]
             if letter == END:
                 yield ''.join(letters)
             elif bag[letter]:
                 bag[letter] -= 1
                 letters.append(letter)
-                for word in self._anagram(bag, link, letters):
+                for word in self._anagram(bag, links[i], letters):
                     yield word
                 letters.pop(-1)
                 bag[letter] += 1
             elif bag[WILD]:
                 bag[WILD] -= 1
                 letters.append(letter)
-                for word in self._anagram(bag, link, letters):
+                for word in self._anagram(bag, links[i], letters):
                     yield word
                 letters.pop(-1)
                 bag[WILD] += 1
-            if not more:
-                break
-            index += 1
 
     def __contains__(self, word):
         index = 0
@@ -241,18 +255,16 @@ class _Dawg(object):
 
     def __iter__(self, index=0, letters=None):
         letters = letters or []
-        while True:
-            more, letter, link = self._get_record(index)
+        chars, links = self.chars, self.links
+        for i in range(index, self.ends[index]):
+            letter = chars[i]
             if letter == END:
                 yield ''.join(letters)
             else:
                 letters.append(letter)
-                for word in self.__iter__(link, letters):
+                for word in self.__iter__(links[i], letters):
                     yield word
                 letters.pop(-1)
-            if not more:
-                break
-            index += 1
 
     def children(self, prefix):
         index = 0